@@ -1,16 +1,28 @@
 # app/configs/database.py
+import os
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from configs.settings import settings
 
 # Configuration du moteur de base de données
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,  # Affiche les requêtes SQL en mode debug
-    pool_pre_ping=True,   # Vérifie la connexion avant utilisation
-    pool_recycle=300      # Renouvelle les connexions toutes les 5 minutes
-)
+if os.environ.get("INIT_SCRIPT") == "1":
+    # Scripts one-shot (init_db.py) : pas de pool à maintenir,
+    # ni de pré-ping par checkout — le process se termine aussitôt
+    engine = create_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        poolclass=NullPool
+    )
+else:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,  # Affiche les requêtes SQL en mode debug
+        pool_pre_ping=True,   # Vérifie la connexion avant utilisation
+        pool_recycle=300      # Renouvelle les connexions toutes les 5 minutes
+    )
 
 # Configuration de la session
 SessionLocal = sessionmaker(
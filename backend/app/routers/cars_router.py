@@ -1,5 +1,6 @@
 # app/routers/cars.py
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from sqlalchemy.orm import Session
 from configs.database import get_db
@@ -14,6 +15,7 @@ from models.schema import (
 )
 from services.cars_service import CarService
 from utils.auth import get_current_active_user, require_vendeur
+from utils.parquet import parquet_response
 from models.database import User
 
 router = APIRouter(prefix="/api/cars", tags=["Cars"])
@@ -37,12 +39,20 @@ def get_cars(
     size: int = Query(20, ge=1, le=100, description="Taille de page"),
     sort_by: str = Query("created_at", description="Champ de tri"),
     sort_order: str = Query("desc", regex="^(asc|desc)$", description="Ordre de tri"),
+    format: Optional[str] = Query(None, regex="^parquet$", description="Format de réponse alternatif"),
     db: Session = Depends(get_db)
 ):
     """
     Récupère la liste des voitures avec pagination
+
+    Avec ?format=parquet, renvoie les lignes en Parquet (transport
+    colonnaire, bien plus rapide que le JSON pour les gros volumes).
     """
     result = CarService.get_cars(db, page, size, sort_by, sort_order)
+
+    if format == "parquet":
+        return parquet_response([CarResponse.from_orm(car) for car in result["items"]])
+
     return PaginatedCars(
         items=[CarResponse.from_orm(car) for car in result["items"]],
         total=result["total"],
@@ -142,6 +152,30 @@ def get_car_statistics(
     return CarService.get_car_statistics(db)
 
 
+@router.get("/stream", response_model=None)
+def stream_cars(db: Session = Depends(get_db)):
+    """
+    Diffuse toutes les voitures en NDJSON (une ligne JSON par voiture)
+
+    Évite au client le motif « récupérer N pages puis tout concaténer » :
+    les lignes sont produites page par page côté serveur et consommées en
+    flux, la mémoire reste bornée des deux côtés.
+    """
+    def generate():
+        page = 1
+        while True:
+            result = CarService.get_cars(db, page, 100, "created_at", "desc")
+
+            for car in result["items"]:
+                yield CarResponse.from_orm(car).model_dump_json() + "\n"
+
+            if page >= result["pages"] or not result["items"]:
+                break
+            page += 1
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/{car_id}", response_model=CarResponse)
 def get_car(car_id: int, db: Session = Depends(get_db)):
     """
@@ -14,6 +14,7 @@ from models.schema import (
 )
 from services.reservation_service import ReservationService
 from utils.auth import get_current_active_user, require_vendeur
+from utils.parquet import parquet_response
 from models.database import User
 
 router = APIRouter(prefix="/api/reservations", tags=["Reservations"])
@@ -37,11 +38,14 @@ def get_reservations(
     size: int = Query(20, ge=1, le=100, description="Taille de page"),
     status_filter: Optional[str] = Query(None, description="Filtrer par statut"),
     type_filter: Optional[str] = Query(None, description="Filtrer par type de transaction"),
+    format: Optional[str] = Query(None, regex="^parquet$", description="Format de réponse alternatif"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """
     Récupère les réservations (toutes pour les vendeurs, personnelles pour les clients)
+
+    Avec ?format=parquet, renvoie les lignes en Parquet.
     """
     result = ReservationService.get_reservations(
         db,
@@ -52,7 +56,12 @@ def get_reservations(
         status_filter=status_filter,
         type_filter=type_filter
     )
-    
+
+    if format == "parquet":
+        return parquet_response(
+            [ReservationResponse.from_orm(reservation) for reservation in result["items"]]
+        )
+
     return PaginatedReservations(
         items=[ReservationResponse.from_orm(reservation) for reservation in result["items"]],
         total=result["total"],
@@ -0,0 +1,37 @@
+# app/utils/parquet.py
+"""
+Sérialisation Parquet des réponses de listes
+
+Pour les gros volumes, le transport colonnaire Parquet est nettement
+plus rapide à (dé)sérialiser que le JSON et réduit les octets sur le
+réseau : le client le lit directement en DataFrame sans repasser par
+une liste de dicts.
+"""
+
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi import Response
+
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
+
+def parquet_response(items) -> Response:
+    """
+    Sérialise une liste de modèles Pydantic en réponse Parquet
+
+    Args:
+        items: Liste de modèles (CarResponse, ReservationResponse, ...)
+
+    Returns:
+        Response: Réponse binaire Parquet
+    """
+    rows = [item.model_dump() for item in items]
+
+    table = pa.Table.from_pylist(rows)
+
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+
+    return Response(content=buffer.getvalue(), media_type=PARQUET_MEDIA_TYPE)
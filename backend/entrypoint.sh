@@ -0,0 +1,11 @@
+#!/bin/sh
+# Entrypoint du conteneur API : initialise la base au premier démarrage
+# (idempotent), puis lance le serveur dans le même process.
+
+set -e
+
+# Initialiser la base seulement si elle n'est pas déjà prête
+python scripts/init_db.py --check || python scripts/init_db.py
+
+# Remplacer le shell par le serveur (pas de process intermédiaire)
+exec python run.py
@@ -6,29 +6,39 @@ Scripts utiles pour le développement
 import subprocess
 import sys
 import os
+import socket
+import time
 import argparse
 from pathlib import Path
 
-def run_command(command, check=True):
+def run_command(command, check=True, env=None):
     """Exécute une commande shell"""
     print(f"🔧 Exécution: {command}")
-    result = subprocess.run(command, shell=True, check=check)
+    result = subprocess.run(command, shell=True, check=check, env=env)
     return result.returncode == 0
 
 def setup_dev_environment():
     """Configure l'environnement de développement"""
     print("🚀 Configuration de l'environnement de développement...")
     
-    commands = [
-        "python -m pip install --upgrade pip",
-        "pip install -r requirements.txt",
-        "cp .env.example .env",
-    ]
-    
-    for cmd in commands:
-        if not run_command(cmd, check=False):
-            print(f"❌ Échec de la commande: {cmd}")
+    if not run_command("python -m pip install --upgrade pip", check=False):
+        print("❌ Échec de la commande: python -m pip install --upgrade pip")
+        return False
+
+    # Préférer les wheels pour éviter de recompiler bcrypt/cryptography depuis les sources
+    if not run_command("pip install --prefer-binary -r requirements.txt", check=False):
+        # Fallback: construire un wheelhouse local réutilisable pour les prochains rebuilds
+        print("⚠️  Installation directe échouée, construction d'un wheelhouse local...")
+        if not run_command("pip wheel -r requirements.txt -w .wheels/", check=False):
+            print("❌ Échec de la construction du wheelhouse")
+            return False
+        if not run_command("pip install --find-links .wheels/ --no-index -r requirements.txt", check=False):
+            print("❌ Échec de l'installation depuis le wheelhouse")
             return False
+
+    if not run_command("cp .env.example .env", check=False):
+        print("❌ Échec de la commande: cp .env.example .env")
+        return False
     
     print("✅ Environnement configuré avec succès!")
     return True
@@ -37,8 +47,8 @@ def run_tests():
     """Lance les tests"""
     print("🧪 Lancement des tests...")
     
-    # Tests unitaires
-    if not run_command("python -m pytest tests/ -v", check=False):
+    # Tests unitaires (parallélisés sur tous les coeurs avec pytest-xdist)
+    if not run_command("python -m pytest tests/ -n auto --dist=loadfile -q", check=False):
         print("❌ Échec des tests unitaires")
         return False
     
@@ -90,53 +100,110 @@ def generate_requirements():
     dev_requirements = [
         "pytest==7.4.3",
         "pytest-asyncio==0.21.1",
+        "pytest-xdist==3.5.0",
         "httpx==0.25.2",
         "black==23.11.0",
         "isort==5.12.0",
         "flake8==6.1.0"
     ]
     
-    with open("requirements.txt", "w") as f:
-        f.write("# Production requirements\n")
-        for req in base_requirements:
-            f.write(f"{req}\n")
-        
-        f.write("\n# Development requirements (optional)\n")
-        for req in dev_requirements:
-            f.write(f"# {req}\n")
-    
+    # Rendu complet en mémoire pour pouvoir comparer avec l'existant
+    lines = ["# Production requirements"]
+    lines.extend(base_requirements)
+    lines.append("")
+    lines.append("# Development requirements (optional)")
+    lines.extend(f"# {req}" for req in dev_requirements)
+    content = "\n".join(lines) + "\n"
+
+    # Ne pas réécrire le fichier si le contenu est identique
+    requirements_file = Path("requirements.txt")
+    if requirements_file.exists() and requirements_file.read_text() == content:
+        print("✅ Requirements.txt déjà à jour, rien à faire")
+        return
+
+    requirements_file.write_text(content)
     print("✅ Requirements.txt généré!")
 
+# Fichiers à exclure du contexte de build Docker (ils dominent le temps
+# d'envoi au daemon sans contribuer à l'image)
+DOCKERIGNORE_CONTENT = """.git/
+.venv/
+__pycache__/
+*.pyc
+backups/
+*.sql
+node_modules/
+.wheels/
+"""
+
+def ensure_dockerignore():
+    """Crée un .dockerignore minimal s'il n'existe pas"""
+    dockerignore = Path(".dockerignore")
+    if not dockerignore.exists():
+        dockerignore.write_text(DOCKERIGNORE_CONTENT)
+        print("📝 .dockerignore créé")
+
 def build_docker():
     """Construit l'image Docker"""
     print("🐳 Construction de l'image Docker...")
-    
+
+    # Réduire le contexte de build et activer BuildKit
+    ensure_dockerignore()
+    env = {**os.environ, "DOCKER_BUILDKIT": "1", "COMPOSE_DOCKER_CLI_BUILD": "1"}
+
     commands = [
         "docker build -t car-dealership-api .",
         "docker tag car-dealership-api car-dealership-api:latest"
     ]
-    
+
     for cmd in commands:
-        if not run_command(cmd):
+        if not run_command(cmd, env=env):
             return False
-    
+
     print("✅ Image Docker construite!")
     return True
 
+def wait_for_services(api_port=8000, attempts=30):
+    """Attend que les services soient prêts (au lieu d'un sleep fixe)"""
+    print("⏳ Attente du démarrage des services...")
+
+    # Attendre que MySQL réponde au ping
+    mysql_ping = "docker-compose exec -T mysql mysqladmin -ucar_user -pcar_password ping"
+    for _ in range(attempts):
+        result = subprocess.run(mysql_ping, shell=True, capture_output=True)
+        if result.returncode == 0:
+            print("✅ MySQL prêt")
+            break
+        time.sleep(0.3)
+
+    # Attendre que l'API accepte les connexions TCP
+    for _ in range(attempts):
+        try:
+            with socket.create_connection(("localhost", api_port), timeout=0.5):
+                print("✅ API prête")
+                return True
+        except OSError:
+            time.sleep(0.3)
+
+    print("⚠️  Les services ne répondent pas encore")
+    return False
+
 def deploy_docker():
     """Déploie avec Docker Compose"""
     print("🚀 Déploiement avec Docker Compose...")
-    
+
     commands = [
         "docker-compose down",
         "docker-compose up --build -d",
-        "sleep 10",  # Attendre que les services démarrent
-        "docker-compose exec -T api python scripts/init_db.py"
     ]
-    
+
     for cmd in commands:
         if not run_command(cmd, check=False):
             print(f"⚠️  Problème avec: {cmd}")
+
+    # Poll actif au lieu d'un sleep 10 inconditionnel.
+    # L'init de la base est gérée par l'entrypoint du conteneur API.
+    wait_for_services()
     
     print("✅ Déploiement terminé!")
     print("📡 API disponible sur: http://localhost:8000")
@@ -182,7 +249,9 @@ def restore_database(backup_file):
 def show_logs():
     """Affiche les logs de l'application"""
     print("📋 Affichage des logs...")
-    run_command("docker-compose logs -f api", check=False)
+    # Remplace le process Python par docker-compose : pas de wrapper
+    # intermédiaire à maintenir en vie, et Ctrl+C arrive directement
+    os.execvp("docker-compose", ["docker-compose", "logs", "-f", "--tail=200", "api"])
 
 def clean_docker():
     """Nettoie les ressources Docker"""
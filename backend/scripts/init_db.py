@@ -14,6 +14,9 @@ from pathlib import Path
 root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
 
+# Script one-shot : utiliser un moteur sans pool (voir app/configs/database.py)
+os.environ.setdefault("INIT_SCRIPT", "1")
+
 from sqlalchemy import text, create_engine
 from app.configs.database import engine, create_tables, SessionLocal
 from app.models.database import User, Car, Reservation
@@ -158,7 +161,11 @@ def reset_database():
     """Remise à zéro complète de la base"""
     logger.warning("⚠️  ATTENTION: Cette opération va SUPPRIMER toutes les données !")
     
-    response = input("Êtes-vous sûr de vouloir continuer ? (tapez 'RESET' pour confirmer): ")
+    # Lecture directe sur stdin : évite l'initialisation de readline
+    # qu'implique input(), inutile pour un prompt unique
+    sys.stdout.write("Êtes-vous sûr de vouloir continuer ? (tapez 'RESET' pour confirmer): ")
+    sys.stdout.flush()
+    response = sys.stdin.readline().strip()
     if response != "RESET":
         logger.info("❌ Opération annulée")
         return False
@@ -187,7 +194,8 @@ def main():
     args = parser.parse_args()
     
     if args.check:
-        check_database_status()
+        # Code de sortie exploitable par l'entrypoint du conteneur
+        sys.exit(0 if check_database_status() else 1)
     elif args.reset:
         reset_database()
     elif args.sample_data:
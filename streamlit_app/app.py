@@ -22,18 +22,17 @@ root_dir = Path(__file__).parent
 sys.path.insert(0, str(root_dir))
 
 # Imports des modules locaux
-from streamlit_app.pages import cars_page, dashboard_page, profile_page
-from streamlit_app.utils.auth_ui_utils import AuthManager
-from utils.api_client import APIClient
+# (les pages sont importées paresseusement dans render_main_app : la page
+# de connexion n'a pas besoin de payer l'import de pandas/plotly)
+from streamlit_app.utils.auth_ui_utils import get_auth_manager
+from utils.api_client import get_api_client
 from utils.session_state import init_session_state, clear_session_state
 from components.sidebar import render_sidebar
 from components.header import render_header
-from streamlit_app.pages import reservations_page
 
-# CSS personnalisé
-def load_css():
-    """Charge les styles CSS personnalisés"""
-    st.markdown("""
+# CSS personnalisé : constante module pour ne pas re-matérialiser la
+# chaîne (~5KB) à chaque rerun du script
+_CSS = """
     <style>
     /* Variables CSS */
     :root {
@@ -228,7 +227,23 @@ def load_css():
         }
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+_FOOTER_HTML = """
+    <div class="main-footer">
+        <p>© 2024 Quantum Motors - Système de Gestion de Concessionnaire</p>
+        <p>Développé avec ❤️ using Streamlit & FastAPI</p>
+    </div>
+    """
+
+def load_css():
+    """Charge les styles CSS personnalisés
+
+    Réémis à chaque run : Streamlit retire du DOM tout élément absent du
+    rerun courant, un <style> injecté une seule fois disparaîtrait dès la
+    deuxième interaction. Le gain vient de la constante _CSS pré-assemblée.
+    """
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 def main():
     """Fonction principale de l'application"""
@@ -239,9 +254,9 @@ def main():
     # Initialisation de l'état de session
     init_session_state()
     
-    # Initialisation des clients
-    auth_manager = AuthManager()
-    api_client = APIClient()
+    # Initialisation des clients (singletons mis en cache)
+    auth_manager = get_auth_manager()
+    api_client = get_api_client()
     
     # Vérification de l'authentification
     if not st.session_state.authenticated:
@@ -251,6 +266,19 @@ def main():
         # Application principale
         render_main_app(api_client)
 
+# Comptes de démonstration affichés sur la page de connexion
+_DEMO_ACCOUNTS = (
+    ("👤 Client Test", "client@test.com", "client123"),
+    ("💼 Vendeur Admin", "admin@cardealership.com", "admin123"),
+)
+
+def _finalize_login(user_data):
+    """Enregistre la session après une connexion réussie"""
+    st.session_state.authenticated = True
+    st.session_state.user = user_data
+    st.session_state.token = user_data.get('access_token')
+    st.rerun()
+
 def render_login_page(auth_manager):
     """Rend la page de connexion"""
     
@@ -280,42 +308,31 @@ def render_login_page(auth_manager):
             
             if login_button:
                 if email and password:
-                    success, user_data, message = auth_manager.login(email, password)
-                    
+                    # Spinner pendant l'appel réseau bloquant
+                    with st.spinner("Authentification..."):
+                        success, user_data, message = auth_manager.login(email, password)
+
                     if success:
-                        st.session_state.authenticated = True
-                        st.session_state.user = user_data
-                        st.session_state.token = user_data.get('access_token')
                         st.success(f"✅ {message}")
-                        st.rerun()
+                        _finalize_login(user_data)
                     else:
                         st.error(f"❌ {message}")
                 else:
                     st.warning("⚠️ Veuillez remplir tous les champs")
-        
+
         # Comptes de démonstration
         st.markdown("---")
         st.subheader("🧪 Comptes de Test")
-        
-        col1_demo, col2_demo = st.columns(2)
-        
-        with col1_demo:
-            if st.button("👤 Client Test", use_container_width=True):
-                success, user_data, message = auth_manager.login("client@test.com", "client123")
-                if success:
-                    st.session_state.authenticated = True
-                    st.session_state.user = user_data
-                    st.session_state.token = user_data.get('access_token')
-                    st.rerun()
-        
-        with col2_demo:
-            if st.button("💼 Vendeur Admin", use_container_width=True):
-                success, user_data, message = auth_manager.login("admin@cardealership.com", "admin123")
-                if success:
-                    st.session_state.authenticated = True
-                    st.session_state.user = user_data
-                    st.session_state.token = user_data.get('access_token')
-                    st.rerun()
+
+        demo_cols = st.columns(len(_DEMO_ACCOUNTS))
+
+        for col, (label, demo_email, demo_password) in zip(demo_cols, _DEMO_ACCOUNTS):
+            with col:
+                if st.button(label, use_container_width=True):
+                    with st.spinner("Authentification..."):
+                        success, user_data, message = auth_manager.login(demo_email, demo_password)
+                    if success:
+                        _finalize_login(user_data)
         
         st.markdown('</div>', unsafe_allow_html=True)
         
@@ -342,14 +359,19 @@ def render_main_app(api_client):
     # Sidebar avec navigation
     selected_page = render_sidebar()
     
-    # Rendu de la page sélectionnée
+    # Rendu de la page sélectionnée (imports paresseux : seule la page
+    # affichée est importée, les suivantes sortent du cache sys.modules)
     if selected_page == "Dashboard":
+        from streamlit_app.pages import dashboard_page
         dashboard_page.render(api_client)
     elif selected_page == "Véhicules":
+        from streamlit_app.pages import cars_page
         cars_page.render(api_client)
     elif selected_page == "Réservations":
+        from streamlit_app.pages import reservations_page
         reservations_page.render(api_client)
     elif selected_page == "Profil":
+        from streamlit_app.pages import profile_page
         profile_page.render(api_client)
     elif selected_page == "Déconnexion":
         clear_session_state()
@@ -360,12 +382,7 @@ def render_main_app(api_client):
 
 def render_footer():
     """Rend le footer de l'application"""
-    st.markdown("""
-    <div class="main-footer">
-        <p>© 2024 Quantum Motors - Système de Gestion de Concessionnaire</p>
-        <p>Développé avec ❤️ using Streamlit & FastAPI</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,67 +3,29 @@
 Composant header principal
 """
 
+import html
+from types import MappingProxyType
+from typing import Final
+
 import streamlit as st
 from datetime import datetime
 from utils.session_state import get_user, get_user_role, display_flash_messages
 
-def render_header():
-    """Rend le header principal de l'application"""
-    
-    # Afficher les messages flash s'il y en a
-    display_flash_messages()
-    
-    # Header principal
-    col1, col2, col3 = st.columns([3, 1, 2])
-    
-    with col1:
-        st.markdown("""
-        <div style="display: flex; align-items: center; gap: 1rem;">
-            <div style="font-size: 2.5rem;">🚗</div>
-            <div>
-                <h1 style="margin: 0; color: #2d3748;">Quantum Motors</h1>
-                <p style="margin: 0; color: #718096; font-size: 1rem;">Gestion de Concessionnaire</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # Heure actuelle
-        current_time = datetime.now().strftime("%H:%M")
-        current_date = datetime.now().strftime("%d/%m/%Y")
-        
-        st.markdown(f"""
-        <div style="text-align: center;">
-            <div style="font-size: 1.5rem; font-weight: bold; color: #3182ce;">{current_time}</div>
-            <div style="font-size: 0.9rem; color: #718096;">{current_date}</div>
+# Template complet du header : un seul st.markdown par rerun au lieu de
+# quatre appels répartis dans trois colonnes
+_HEADER_TEMPLATE = """
+<div style="display: flex; align-items: center; justify-content: space-between; gap: 1rem;">
+    <div style="display: flex; align-items: center; gap: 1rem;">
+        <div style="font-size: 2.5rem;">🚗</div>
+        <div>
+            <h1 style="margin: 0; color: #2d3748;">Quantum Motors</h1>
+            <p style="margin: 0; color: #718096; font-size: 1rem;">Gestion de Concessionnaire</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        render_user_status()
-    
-    # Ligne de séparation
-    st.markdown("---")
-
-def render_user_status():
-    """Rend le statut utilisateur dans le header"""
-    user = get_user()
-    role = get_user_role()
-    
-    # Badge de statut utilisateur
-    role_color = {
-        "vendeur": "#3182ce",
-        "client": "#38a169",
-        "admin": "#e53e3e"
-    }.get(role, "#718096")
-    
-    role_icon = {
-        "vendeur": "💼",
-        "client": "👤", 
-        "admin": "⚡"
-    }.get(role, "👤")
-    
-    st.markdown(f"""
+    </div>
+    <div style="text-align: center;">
+        <div style="font-size: 1.5rem; font-weight: bold; color: #3182ce;">{time}</div>
+        <div style="font-size: 0.9rem; color: #718096;">{date}</div>
+    </div>
     <div style="text-align: right;">
         <div style="
             display: inline-block;
@@ -74,13 +36,67 @@ def render_user_status():
             font-size: 0.9rem;
             font-weight: 600;
         ">
-            {role_icon} {role.title()}
+            {role_icon} {role}
         </div>
         <div style="font-size: 0.9rem; color: #718096; margin-top: 0.25rem;">
-            {user.get('prenom', '')} {user.get('nom', '')}
+            {prenom} {nom}
         </div>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+"""
+
+# Style (couleur, icône) par rôle, construit une seule fois à l'import
+# plutôt que deux dict littéraux par rerun (lecture seule)
+_ROLE_STYLE: Final = MappingProxyType({
+    "vendeur": ("#3182ce", "💼"),
+    "client": ("#38a169", "👤"),
+    "admin": ("#e53e3e", "⚡")
+})
+_ROLE_DEFAULT = ("#718096", "👤")
+
+# Palettes des bannières de statut (mêmes raisons)
+_BANNER_COLORS: Final = MappingProxyType({
+    "success": {"bg": "#f0fff4", "border": "#68d391", "text": "#22543d"},
+    "error": {"bg": "#fed7d7", "border": "#fc8181", "text": "#742a2a"},
+    "warning": {"bg": "#fffbeb", "border": "#f6ad55", "text": "#744210"},
+    "info": {"bg": "#ebf8ff", "border": "#63b3ed", "text": "#2c5282"}
+})
+_BANNER_ICONS: Final = MappingProxyType({
+    "success": "✅",
+    "error": "❌",
+    "warning": "⚠️",
+    "info": "ℹ️"
+})
+
+# Templates de spans pour le fil d'Ariane
+_BC_ACTIVE = '<span style="color: #3182ce;">{}</span>'
+_BC_INACTIVE = '<span style="color: #718096;">{}</span>'
+
+def render_header():
+    """Rend le header principal de l'application"""
+
+    # Afficher les messages flash s'il y en a
+    display_flash_messages()
+
+    # Lire session_state une seule fois par render
+    user = get_user()
+    role = get_user_role()
+    now = datetime.now()
+
+    role_color, role_icon = _ROLE_STYLE.get(role, _ROLE_DEFAULT)
+
+    st.markdown(_HEADER_TEMPLATE.format(
+        time=now.strftime("%H:%M"),
+        date=now.strftime("%d/%m/%Y"),
+        role_color=role_color,
+        role_icon=role_icon,
+        role=role.title(),
+        prenom=user.get('prenom', ''),
+        nom=user.get('nom', '')
+    ), unsafe_allow_html=True)
+
+    # Ligne de séparation
+    st.markdown("---")
 
 def render_page_header(title: str, subtitle: str = "", icon: str = "📄"):
     """
@@ -114,11 +130,13 @@ def render_breadcrumb(items: list):
     Args:
         items: Liste des éléments du breadcrumb
     """
-    breadcrumb_html = " > ".join([
-        f'<span style="color: #3182ce;">{item}</span>' if i == len(items) - 1 
-        else f'<span style="color: #718096;">{item}</span>'
+    # Générateur + templates pré-cuits : pas de liste intermédiaire,
+    # et chaque élément est échappé (sécurité HTML)
+    last = len(items) - 1
+    breadcrumb_html = " &gt; ".join(
+        (_BC_ACTIVE if i == last else _BC_INACTIVE).format(html.escape(str(item)))
         for i, item in enumerate(items)
-    ])
+    )
     
     st.markdown(f"""
     <div style="
@@ -139,24 +157,27 @@ def render_search_bar(placeholder: str = "Rechercher...", key: str = "search"):
     Args:
         placeholder: Texte placeholder
         key: Clé unique pour le widget
-        
+
     Returns:
-        str: Terme de recherche
+        Optional[str]: Terme de recherche si soumis (bouton ou Entrée), sinon None
     """
-    col1, col2 = st.columns([4, 1])
-    
-    with col1:
-        search_term = st.text_input(
-            "",
-            placeholder=placeholder,
-            key=key,
-            label_visibility="collapsed"
-        )
-    
-    with col2:
-        search_button = st.button("🔍 Rechercher", use_container_width=True)
-    
-    return search_term if search_button or search_term else ""
+    # Formulaire : une seule soumission explicite au lieu d'une recherche
+    # backend déclenchée à chaque frappe
+    with st.form(f"{key}_form", clear_on_submit=False):
+        col1, col2 = st.columns([4, 1])
+
+        with col1:
+            search_term = st.text_input(
+                "",
+                placeholder=placeholder,
+                key=key,
+                label_visibility="collapsed"
+            )
+
+        with col2:
+            submitted = st.form_submit_button("🔍 Rechercher", use_container_width=True)
+
+    return search_term if submitted else None
 
 def render_action_bar(actions: list):
     """
@@ -166,24 +187,20 @@ def render_action_bar(actions: list):
         actions: Liste de dictionnaires avec 'label', 'action', 'type'
     """
     cols = st.columns(len(actions))
-    
+
     results = {}
-    
+
     for i, action in enumerate(actions):
         with cols[i]:
+            # st.button ne connaît que primary/secondary : 'danger' est rendu
+            # en secondary
             button_type = action.get('type', 'primary')
-            
-            # Configuration du bouton selon le type
-            if button_type == 'primary':
-                if st.button(action['label'], use_container_width=True):
-                    results[action['action']] = True
-            elif button_type == 'secondary':
-                if st.button(action['label'], use_container_width=True):
-                    results[action['action']] = True
-            elif button_type == 'danger':
-                if st.button(action['label'], use_container_width=True):
-                    results[action['action']] = True
-    
+            if button_type == 'danger':
+                button_type = 'secondary'
+
+            if st.button(action['label'], use_container_width=True, type=button_type):
+                results[action['action']] = True
+
     return results
 
 def render_status_banner(message: str, status_type: str = "info"):
@@ -194,23 +211,8 @@ def render_status_banner(message: str, status_type: str = "info"):
         message: Message à afficher
         status_type: Type de statut (success, error, warning, info)
     """
-    colors = {
-        "success": {"bg": "#f0fff4", "border": "#68d391", "text": "#22543d"},
-        "error": {"bg": "#fed7d7", "border": "#fc8181", "text": "#742a2a"},
-        "warning": {"bg": "#fffbeb", "border": "#f6ad55", "text": "#744210"},
-        "info": {"bg": "#ebf8ff", "border": "#63b3ed", "text": "#2c5282"}
-    }
-    
-    color_scheme = colors.get(status_type, colors["info"])
-    
-    icons = {
-        "success": "✅",
-        "error": "❌", 
-        "warning": "⚠️",
-        "info": "ℹ️"
-    }
-    
-    icon = icons.get(status_type, "ℹ️")
+    color_scheme = _BANNER_COLORS.get(status_type, _BANNER_COLORS["info"])
+    icon = _BANNER_ICONS.get(status_type, "ℹ️")
     
     st.markdown(f"""
     <div style="
@@ -229,31 +231,39 @@ def render_status_banner(message: str, status_type: str = "info"):
     </div>
     """, unsafe_allow_html=True)
 
+# CSS statique du spinner : injecté une seule fois par session au lieu
+# de dupliquer un bloc <style> à chaque appel
+_SPIN_CSS = """
+<style>
+@keyframes spin {
+    0% { transform: rotate(0deg); }
+    100% { transform: rotate(360deg); }
+}
+.spinner-wrap {
+    text-align: center;
+    padding: 2rem;
+    color: #718096;
+}
+.spinner-dot {
+    display: inline-block;
+    width: 40px;
+    height: 40px;
+    border: 4px solid #e2e8f0;
+    border-top: 4px solid #3182ce;
+    border-radius: 50%;
+    animation: spin 1s linear infinite;
+    margin-bottom: 1rem;
+}
+</style>
+"""
+
 def render_loading_spinner(message: str = "Chargement..."):
     """Rend un spinner de chargement"""
-    st.markdown(f"""
-    <div style="
-        text-align: center;
-        padding: 2rem;
-        color: #718096;
-    ">
-        <div style="
-            display: inline-block;
-            width: 40px;
-            height: 40px;
-            border: 4px solid #e2e8f0;
-            border-top: 4px solid #3182ce;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin-bottom: 1rem;
-        "></div>
-        <p>{message}</p>
-    </div>
-    
-    <style>
-    @keyframes spin {{
-        0% {{ transform: rotate(0deg); }}
-        100% {{ transform: rotate(360deg); }}
-    }}
-    </style>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    # Réémis à chaque run : un <style> non rejoué disparaît du DOM
+    st.markdown(_SPIN_CSS, unsafe_allow_html=True)
+
+    st.markdown(
+        f'<div class="spinner-wrap"><div class="spinner-dot"></div>'
+        f'<p>{html.escape(message)}</p></div>',
+        unsafe_allow_html=True
+    )
\ No newline at end of file
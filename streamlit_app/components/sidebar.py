@@ -3,81 +3,91 @@
 Composant de navigation sidebar
 """
 
+from functools import lru_cache
+
 import streamlit as st
-from utils.session_state import get_user, get_user_role
+from utils.session_state import get_token, get_user, get_user_role, refresh_all
+
+# Libellés des rôles : constante module plutôt qu'un dict littéral
+# reconstruit à chaque render de la sidebar
+_ROLE_MAP = {
+    "vendeur": "💼 Vendeur",
+    "client": "👤 Client",
+    "admin": "⚡ Administrateur"
+}
+
+# Pages par rôle : tuples immuables construits à l'import, plus de
+# list + extend à chaque rerun
+_PAGES_BY_ROLE = {
+    "vendeur": ("Dashboard", "Véhicules", "Réservations", "Profil"),
+    "client": ("Dashboard", "Véhicules", "Mes Réservations", "Profil"),
+    None: ("Dashboard", "Profil")
+}
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _probe_api(_api_client):
+    """Teste la connexion API avec un cache court
+
+    Les clics répétés sur « Tester API » (fréquents en débogage)
+    resservent le résultat pendant 30 s au lieu de repayer le round-trip.
+    """
+    return _api_client.test_connection()
 
 def render_sidebar():
     """Rend la sidebar avec navigation"""
-    
+
+    # Lire session_state une seule fois et propager aux sous-composants
+    user = get_user()
+    role = get_user_role()
+
     with st.sidebar:
+        # CSS de la sidebar : réémis à chaque run (un <style> non rejoué
+        # disparaît du DOM), seule la constante est pré-assemblée
+        st.markdown(SIDEBAR_CSS, unsafe_allow_html=True)
+
         # Header utilisateur
-        render_user_info()
+        render_user_info(user, role)
         
         st.markdown("---")
         
         # Navigation principale
-        selected_page = render_navigation()
+        selected_page = render_navigation(role)
         
         st.markdown("---")
         
         # Outils et utilitaires
-        render_tools()
+        render_tools(role)
         
         # Footer sidebar
         render_sidebar_footer()
     
     return selected_page
 
-def render_user_info():
+def render_user_info(user, role):
     """Affiche les informations utilisateur"""
-    user = get_user()
-    role = get_user_role()
     
-    # Avatar et nom
+    # Avatar et nom (styles portés par les classes de SIDEBAR_CSS)
     st.markdown(f"""
-    <div style="text-align: center; padding: 1rem 0;">
-        <div style="
-            width: 60px; 
-            height: 60px; 
-            border-radius: 50%; 
-            background: linear-gradient(135deg, #3182ce, #4299e1);
-            color: white;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.5rem;
-            font-weight: bold;
-            margin: 0 auto 0.5rem auto;
-        ">
-            {get_user_initials()}
+    <div class="sidebar-user">
+        <div class="user-avatar">
+            {get_user_initials(user.get('prenom', ''), user.get('nom', ''))}
         </div>
-        <div style="font-weight: bold; color: #2d3748;">
+        <div class="user-name">
             {user.get('prenom', '')} {user.get('nom', '')}
         </div>
-        <div style="color: #718096; font-size: 0.9rem;">
+        <div class="user-role">
             {get_role_display(role)}
         </div>
     </div>
     """, unsafe_allow_html=True)
 
-def render_navigation():
+def render_navigation(user_role):
     """Rend le menu de navigation"""
-    user_role = get_user_role()
-    
+
     # Menu principal
     st.markdown("### 🧭 Navigation")
-    
-    # Pages accessibles à tous
-    pages = ["Dashboard"]
-    
-    # Pages spécifiques au rôle
-    if user_role == "vendeur":
-        pages.extend(["Véhicules", "Réservations"])
-    elif user_role == "client":
-        pages.extend(["Véhicules", "Mes Réservations"])
-    
-    # Page profil accessible à tous
-    pages.append("Profil")
+
+    pages = _PAGES_BY_ROLE.get(user_role, _PAGES_BY_ROLE[None])
     
     # Sélection de la page
     selected = st.radio(
@@ -94,33 +104,45 @@ def render_navigation():
     
     return selected
 
-def render_tools():
-    """Rend les outils et utilitaires"""
+@st.fragment
+def render_tools(role):
+    """Rend les outils et utilitaires
+
+    Fragment : un clic sur un outil ne relance que ce bloc, pas tout
+    le script (le dashboard n'est pas reconstruit).
+    """
     st.markdown("### 🛠️ Outils")
+
+    # Actualiser les données : le callback vide les caches avant le
+    # rerun, mais dans un fragment le rerun du clic reste limité au
+    # fragment — st.rerun(scope="app") force le repaint du dashboard
+    if st.button("🔄 Actualiser", on_click=refresh_all, use_container_width=True):
+        st.rerun(scope="app")
     
-    # Actualiser les données
-    if st.button("🔄 Actualiser", use_container_width=True):
-        # Vider le cache pour forcer le rechargement
-        from utils.session_state import clear_cache
-        clear_cache()
-        st.success("✅ Données actualisées")
-        st.rerun()
-    
-    # Test connexion API
-    if st.button("🔌 Tester API", use_container_width=True):
-        from utils.api_client import APIClient
-        api_client = APIClient()
-        
-        with st.spinner("Test en cours..."):
-            success, message = api_client.test_connection()
-            
-            if success:
-                st.success(message)
-            else:
-                st.error(message)
+    # Test connexion API (résultat mis en cache 30 s)
+    col_test, col_force = st.columns(2)
+
+    with col_force:
+        force_retest = st.button("♻️ Re-tester", use_container_width=True)
+
+    with col_test:
+        if st.button("🔌 Tester API", use_container_width=True) or force_retest:
+            from utils.api_client import get_api_client
+            api_client = get_api_client()
+
+            if force_retest:
+                _probe_api.clear()
+
+            with st.spinner("Test en cours..."):
+                success, message = _probe_api(api_client)
+
+                if success:
+                    st.success(message)
+                else:
+                    st.error(message)
     
     # Paramètres (pour les vendeurs)
-    if get_user_role() == "vendeur":
+    if role == "vendeur":
         with st.expander("⚙️ Paramètres Avancés"):
             
             # Debug mode
@@ -129,11 +151,10 @@ def render_tools():
                 from utils.session_state import debug_session_state
                 debug_session_state()
             
-            # Vider le cache
-            if st.button("🗑️ Vider le Cache", use_container_width=True):
-                from utils.session_state import clear_cache
-                clear_cache()
-                st.success("Cache vidé")
+            # Vider le cache (rerun app : voir le bouton Actualiser)
+            if st.button("🗑️ Vider le Cache", on_click=refresh_all,
+                         use_container_width=True):
+                st.rerun(scope="app")
 
 def render_sidebar_footer():
     """Rend le footer de la sidebar"""
@@ -156,12 +177,13 @@ def render_sidebar_footer():
         - [💻 Code Source](https://github.com/quantum-motors)
         """)
 
-def get_user_initials():
-    """Retourne les initiales de l'utilisateur"""
-    user = get_user()
-    prenom = user.get('prenom', '')
-    nom = user.get('nom', '')
-    
+@lru_cache(maxsize=32)
+def get_user_initials(prenom: str = "", nom: str = ""):
+    """Retourne les initiales pour un couple (prenom, nom)
+
+    Mémoïsé : le calcul (slicing + upper) ne se refait pas à chaque
+    rerun pour le même utilisateur.
+    """
     initials = ""
     if prenom:
         initials += prenom[0].upper()
@@ -172,31 +194,20 @@ def get_user_initials():
 
 def get_role_display(role: str) -> str:
     """Convertit le rôle en affichage lisible"""
-    role_map = {
-        "vendeur": "💼 Vendeur",
-        "client": "👤 Client",
-        "admin": "⚡ Administrateur"
-    }
-    
-    return role_map.get(role, f"👤 {role.title()}")
+    return _ROLE_MAP.get(role, f"👤 {role.title()}")
 
 def render_quick_stats():
     """Affiche des statistiques rapides dans la sidebar"""
-    from utils.api_client import APIClient
-    from utils.session_state import get_cached_data, cache_data
-    
-    api_client = APIClient()
-    
-    # Vérifier le cache
-    stats = get_cached_data("quick_stats")
-    
-    if stats is None:
-        # Charger les statistiques
-        with st.spinner("Chargement des stats..."):
-            success, stats, _ = api_client.get_dashboard_stats()
-            
-            if success:
-                cache_data("quick_stats", stats, expiry_minutes=5)
+    from utils.api_client import get_api_client
+    from pages.dashboard_page import _load_stats
+
+    api_client = get_api_client()
+
+    # Même loader mis en cache que le dashboard : pas de double fetch
+    with st.spinner("Chargement des stats..."):
+        success, stats, _ = _load_stats(api_client, get_token())
+        if not success:
+            stats = None
     
     if stats:
         st.markdown("### 📊 Aperçu Rapide")
@@ -217,39 +228,42 @@ def render_quick_stats():
                 delta=None
             )
 
-def render_notifications():
-    """Affiche les notifications dans la sidebar"""
-    user_role = get_user_role()
-    
+@st.fragment
+def render_notifications(user_role):
+    """Affiche les notifications dans la sidebar
+
+    Fragment + expander replié : le corps ne s'exécute qu'à l'ouverture,
+    hors du chemin chaud de la sidebar.
+    """
+
     if user_role == "vendeur":
-        st.markdown("### 🔔 Notifications")
-        
-        # Simuler quelques notifications (à remplacer par de vraies données)
-        notifications = [
-            {"type": "warning", "message": "3 réservations en attente"},
-            {"type": "info", "message": "Nouveau véhicule ajouté"},
-            {"type": "success", "message": "Vente confirmée"}
-        ]
-        
-        for notif in notifications:
-            icon = {
-                "warning": "⚠️",
-                "info": "ℹ️", 
-                "success": "✅",
-                "error": "❌"
-            }.get(notif["type"], "📝")
-            
-            st.markdown(f"{icon} {notif['message']}")
+        with st.expander("🔔 Notifications", expanded=False):
+            # Simuler quelques notifications (à remplacer par de vraies données)
+            notifications = [
+                {"type": "warning", "message": "3 réservations en attente"},
+                {"type": "info", "message": "Nouveau véhicule ajouté"},
+                {"type": "success", "message": "Vente confirmée"}
+            ]
+
+            for notif in notifications:
+                icon = {
+                    "warning": "⚠️",
+                    "info": "ℹ️",
+                    "success": "✅",
+                    "error": "❌"
+                }.get(notif["type"], "📝")
+
+                st.markdown(f"{icon} {notif['message']}")
 
+@st.fragment
 def render_weather_widget():
     """Widget météo simple (optionnel)"""
-    st.markdown("### 🌤️ Météo")
-    
-    # Simuler des données météo (à remplacer par une vraie API)
-    st.markdown("""
-    **Paris** ☀️ 22°C  
-    Ensoleillé - Vent: 15 km/h
-    """)
+    with st.expander("🌤️ Météo", expanded=False):
+        # Simuler des données météo (à remplacer par une vraie API)
+        st.markdown("""
+        **Paris** ☀️ 22°C  
+        Ensoleillé - Vent: 15 km/h
+        """)
 
 # Style CSS pour la sidebar
 SIDEBAR_CSS = """
@@ -258,17 +272,33 @@ SIDEBAR_CSS = """
     padding: 1rem;
 }
 
+.sidebar-user {
+    text-align: center;
+    padding: 1rem 0;
+}
+
 .user-avatar {
-    width: 50px;
-    height: 50px;
+    width: 60px;
+    height: 60px;
     border-radius: 50%;
     background: linear-gradient(135deg, #3182ce, #4299e1);
     color: white;
     display: flex;
     align-items: center;
     justify-content: center;
+    font-size: 1.5rem;
     font-weight: bold;
-    margin: 0 auto;
+    margin: 0 auto 0.5rem auto;
+}
+
+.user-name {
+    font-weight: bold;
+    color: #2d3748;
+}
+
+.user-role {
+    color: #718096;
+    font-size: 0.9rem;
 }
 
 .sidebar-metric {
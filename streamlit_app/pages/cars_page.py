@@ -13,6 +13,9 @@ def render(api_client):
     if success:
         st.write(f"📊 {len(cars)} véhicules trouvés")
         if cars:
-            st.json(cars[0])  # Affichage du premier véhicule
+            # Aperçu en dataframe (transport Arrow) plutôt qu'un st.json
+            # coûteux à sérialiser/surligner
+            import pandas as pd
+            st.dataframe(pd.DataFrame(cars[:50]), use_container_width=True)
     else:
         st.error(f"❌ {message}")
\ No newline at end of file
@@ -3,69 +3,122 @@
 Page Dashboard - Vue d'ensemble de l'activité
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime, timedelta
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from components.header import render_page_header, render_loading_spinner
-from utils.session_state import get_cached_data, cache_data, get_user_role
+from utils.persistent_cache import disk_memoize
+from utils.session_state import get_token, get_user_role, refresh_all
 from utils.api_client import APIClient
 
+# Loaders mis en cache par Streamlit (TTL 3 min) : partagés entre toutes
+# les sessions du process, contrairement au cache manuel par session.
+# L'argument _api_client est préfixé d'un underscore pour que Streamlit
+# ne tente pas de le hasher. La couche disk_memoize en dessous persiste
+# les réponses sur disque : un redémarrage de l'app repeint depuis le
+# cache au lieu de repayer les appels API.
+# Le token fait partie de la clé des deux couches : les caches sont
+# partagés entre toutes les sessions du process, sans lui un utilisateur
+# pourrait relire les données d'un autre.
+
+@st.cache_data(ttl=180, show_spinner=False)
+@disk_memoize(expire=600)
+def _load_stats(_api_client, token):
+    return _api_client.get_dashboard_stats()
+
+@st.cache_data(ttl=180, show_spinner=False)
+@disk_memoize(expire=600)
+def _load_cars(_api_client, token, size: int = 10):
+    # Tri décroissant sur created_at côté serveur : les "derniers ajoutés"
+    # sont corrects même quand la base contient plus de `size` lignes
+    return _api_client.get_cars(size=size, order_by="created_at", desc=True)
+
+@st.cache_data(ttl=180, show_spinner=False)
+@disk_memoize(expire=600)
+def _load_reservations(_api_client, token, size: int = 5):
+    # Le backend renvoie toujours les réservations en created_at desc
+    return _api_client.get_reservations(size=size)
+
 def render(api_client: APIClient):
     """Rend la page dashboard"""
-    
+
+    # CSS des cartes : réémis à chaque run (un <style> non rejoué
+    # disparaît du DOM), seule la constante est pré-assemblée
+    st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
+
     # Header de la page
     render_page_header(
-        "Tableau de Bord", 
+        "Tableau de Bord",
         "Vue d'ensemble de l'activité du concessionnaire",
         "📊"
     )
-    
-    # Chargement des données
-    stats_data = load_dashboard_data(api_client)
-    
-    if stats_data:
-        # Métriques principales
-        render_main_metrics(stats_data)
-        
-        st.markdown("---")
-        
-        # Graphiques et analyses
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            render_cars_chart(stats_data, api_client)
-        
-        with col2:
-            render_reservations_chart(stats_data, api_client)
-        
-        st.markdown("---")
-        
-        # Activité récente et tableaux
-        render_recent_activity(api_client)
-        
-    else:
-        st.error("❌ Impossible de charger les données du dashboard")
 
-def load_dashboard_data(api_client: APIClient):
-    """Charge les données du dashboard avec cache"""
-    
-    # Vérifier le cache
-    cached_stats = get_cached_data("dashboard_stats")
-    
-    if cached_stats is None:
-        with st.spinner("Chargement des statistiques..."):
-            success, stats_data, message = api_client.get_dashboard_stats()
-            
-            if success:
-                cache_data("dashboard_stats", stats_data, expiry_minutes=3)
-                return stats_data
-            else:
-                st.error(f"Erreur: {message}")
-                return None
-    
-    return cached_stats
+    # Placeholders alloués d'emblée : chaque zone est remplie dès que
+    # son appel API résout, au lieu de tout bloquer derrière un spinner
+    metrics_ph = st.empty()
+    charts_ph = st.empty()
+    activity_ph = st.empty()
+
+    metrics_ph.info("⏳ Chargement des statistiques...")
+
+    ctx = get_script_run_ctx()
+
+    # Les trois appels API sont indépendants : ils partent en parallèle,
+    # et les loaders sont décorés de @st.cache_data (seuls les appels non
+    # encore en cache paient un round-trip réseau)
+    token = get_token()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        stats_future = executor.submit(
+            _call_with_ctx, ctx, _load_stats, api_client, token)
+        cars_future = executor.submit(
+            _call_with_ctx, ctx, _load_cars, api_client, token, size=10)
+        reservations_future = executor.submit(
+            _call_with_ctx, ctx, _load_reservations, api_client, token, size=5)
+
+        # 1. Les métriques ne dépendent que des stats : premier coup de pinceau
+        stats_success, stats_data, message = stats_future.result()
+
+        if not stats_success:
+            metrics_ph.error(f"❌ Impossible de charger les données du dashboard ({message})")
+            return
+
+        with metrics_ph.container():
+            render_main_metrics(stats_data)
+
+        # 2. Les graphiques attendent aussi la liste des voitures
+        # (tableau de détails dans l'expander)
+        cars_success, cars_data, _ = cars_future.result()
+        cars_data = cars_data if cars_success else []
+
+        with charts_ph.container():
+            st.markdown("---")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                render_cars_chart(stats_data, api_client, cars_data)
+
+            with col2:
+                render_reservations_chart(stats_data, api_client)
+
+        # 3. L'activité récente arrive en dernier
+        reservations_success, reservations_data, _ = reservations_future.result()
+        reservations_data = reservations_data if reservations_success else []
+
+        with activity_ph.container():
+            st.markdown("---")
+            render_recent_activity(cars_data, reservations_data)
+
+def _call_with_ctx(ctx, func, *args, **kwargs):
+    """Exécute un appel API dans un thread en propageant le contexte Streamlit"""
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return func(*args, **kwargs)
 
 def render_main_metrics(stats_data):
     """Rend les métriques principales"""
@@ -86,149 +139,181 @@ def render_main_metrics(stats_data):
     sales_rate = (sold_cars / total_cars * 100) if total_cars > 0 else 0
     availability_rate = (available_cars / total_cars * 100) if total_cars > 0 else 0
     
-    # Affichage en colonnes
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        render_metric_card(
-            "🚗 Total Véhicules",
-            total_cars,
-            f"{availability_rate:.1f}% disponibles"
-        )
-    
-    with col2:
-        render_metric_card(
-            "✅ Disponibles",
-            available_cars,
-            f"Sur {total_cars} véhicules"
-        )
-    
-    with col3:
-        render_metric_card(
-            "💰 Vendues",
-            sold_cars,
-            f"{sales_rate:.1f}% du stock"
-        )
-    
-    with col4:
-        render_metric_card(
-            "📋 Réservations",
-            total_reservations,
-            f"{pending_reservations} en attente"
-        )
+    # Une seule chaîne HTML flex pour les 4 cartes : un seul message
+    # delta vers le frontend au lieu de 8 (4 colonnes + 4 markdown)
+    cards = (
+        ("🚗 Total Véhicules", total_cars, f"{availability_rate:.1f}% disponibles"),
+        ("✅ Disponibles", available_cars, f"Sur {total_cars} véhicules"),
+        ("💰 Vendues", sold_cars, f"{sales_rate:.1f}% du stock"),
+        ("📋 Réservations", total_reservations, f"{pending_reservations} en attente"),
+    )
+
+    st.markdown(
+        '<div class="dash-metrics">'
+        + "".join(_card_html(title, value, subtitle) for title, value, subtitle in cards)
+        + '</div>',
+        unsafe_allow_html=True
+    )
+
+# CSS du dashboard : classes injectées une seule fois par session, les
+# cartes ne transportent plus que des attributs class= (le payload HTML
+# par render tombe de plusieurs centaines d'octets à quelques dizaines)
+DASHBOARD_CSS = """
+<style>
+.dash-metrics {
+    display: flex;
+    gap: 1rem;
+}
+
+.dash-metric-card {
+    flex: 1;
+    background: white;
+    padding: 1.5rem;
+    border-radius: 12px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    text-align: center;
+    border-left: 4px solid #3182ce;
+}
+
+.dash-metric-card h3 {
+    margin: 0;
+    color: #718096;
+    font-size: 0.9rem;
+    font-weight: 600;
+}
+
+.dash-metric-card h1 {
+    margin: 0.5rem 0;
+    color: #2d3748;
+    font-size: 2.5rem;
+    font-weight: bold;
+}
+
+.dash-metric-card p {
+    margin: 0;
+    color: #4a5568;
+    font-size: 0.8rem;
+}
+</style>
+"""
+
+# Template pré-compilé à l'import : render_metric_card ne fait plus que
+# substituer 3 champs au lieu de re-parser le HTML à chaque carte
+_METRIC_CARD_TEMPLATE = Template(
+    '<div class="dash-metric-card">'
+    '<h3>$title</h3>'
+    '<h1>$value</h1>'
+    '<p>$subtitle</p>'
+    '</div>'
+)
+
+def _card_html(title, value, subtitle):
+    """Retourne le HTML d'une carte de métrique"""
+    return _METRIC_CARD_TEMPLATE.substitute(title=title, value=value, subtitle=subtitle)
 
 def render_metric_card(title, value, subtitle):
-    """Rend une carte de métrique"""
-    st.markdown(f"""
-    <div style="
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        text-align: center;
-        border-left: 4px solid #3182ce;
-    ">
-        <h3 style="margin: 0; color: #718096; font-size: 0.9rem; font-weight: 600;">
-            {title}
-        </h3>
-        <h1 style="margin: 0.5rem 0; color: #2d3748; font-size: 2.5rem; font-weight: bold;">
-            {value}
-        </h1>
-        <p style="margin: 0; color: #4a5568; font-size: 0.8rem;">
-            {subtitle}
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-def render_cars_chart(stats_data, api_client: APIClient):
-    """Rend le graphique de répartition des voitures"""
-    
-    st.subheader("🚗 Répartition des Véhicules")
-    
-    # Données pour le graphique
-    cars_data = {
-        "Statut": ["Disponible", "Loué", "Vendu"],
-        "Nombre": [
-            stats_data.get("available_cars", 0),
-            stats_data.get("rented_cars", 0),
-            stats_data.get("sold_cars", 0)
-        ],
-        "Couleur": ["#38a169", "#d69e2e", "#e53e3e"]
-    }
-    
-    df_cars = pd.DataFrame(cars_data)
-    
-    # Graphique en secteurs
+    """Rend une carte de métrique isolée"""
+    st.markdown(_card_html(title, value, subtitle), unsafe_allow_html=True)
+
+# Construction des figures Plotly mise en cache : tant que les compteurs
+# ne changent pas, la même go.Figure est resservie au lieu d'être
+# reconstruite (plusieurs ms de manipulation de dicts) à chaque rerun
+
+@st.cache_data(ttl=180)
+def _build_cars_pie(counts):
+    """Construit le camembert de répartition pour (disponibles, loués, vendus)"""
+    import plotly.express as px
+
+    # px.pie accepte des listes : pas besoin du détour par un DataFrame
     fig_pie = px.pie(
-        df_cars,
-        values="Nombre",
-        names="Statut",
-        color_discrete_sequence=cars_data["Couleur"],
+        values=list(counts),
+        names=["Disponible", "Loué", "Vendu"],
+        color_discrete_sequence=["#38a169", "#d69e2e", "#e53e3e"],
         title="Répartition par Statut"
     )
-    
+
     fig_pie.update_layout(
         height=300,
         showlegend=True,
         font=dict(size=12)
     )
-    
-    st.plotly_chart(fig_pie, use_container_width=True)
-    
-    # Tableau de détails
-    with st.expander("📋 Détails des véhicules"):
-        render_cars_summary_table(api_client)
 
-def render_reservations_chart(stats_data, api_client: APIClient):
-    """Rend le graphique des réservations"""
-    
-    st.subheader("📋 État des Réservations")
-    
-    # Données pour le graphique
-    reservations_data = {
-        "Statut": ["En attente", "Confirmée", "Terminée"],
-        "Nombre": [
-            stats_data.get("pending_reservations", 0),
-            stats_data.get("confirmed_reservations", 0),
-            stats_data.get("completed_reservations", 0)
-        ]
-    }
-    
-    df_reservations = pd.DataFrame(reservations_data)
-    
-    # Graphique en barres
+    return fig_pie
+
+@st.cache_data(ttl=180)
+def _build_res_bar(counts):
+    """Construit le graphique en barres pour (en attente, confirmées, terminées)"""
+    import plotly.express as px
+
     fig_bar = px.bar(
-        df_reservations,
-        x="Statut",
-        y="Nombre",
-        color="Statut",
+        x=["En attente", "Confirmée", "Terminée"],
+        y=list(counts),
+        color=["En attente", "Confirmée", "Terminée"],
         color_discrete_map={
             "En attente": "#d69e2e",
-            "Confirmée": "#38a169", 
+            "Confirmée": "#38a169",
             "Terminée": "#3182ce"
         },
         title="Réservations par Statut"
     )
-    
+
     fig_bar.update_layout(
         height=300,
         showlegend=False,
         xaxis_title="",
         yaxis_title="Nombre de réservations"
     )
+
+    return fig_bar
+
+# Pas de @st.fragment sur les renderers ci-dessous : ils sont hébergés
+# dans les placeholders st.empty() de render(), combinaison non
+# supportée par les fragments (et aucun widget n'y justifie un rerun
+# partiel)
+def render_cars_chart(stats_data, api_client: APIClient, cars_data=None):
+    """Rend le graphique de répartition des voitures"""
+
+    st.subheader("🚗 Répartition des Véhicules")
+
+    # Tuple hashable : clé de cache pour la figure
+    fig_pie = _build_cars_pie((
+        stats_data.get("available_cars", 0),
+        stats_data.get("rented_cars", 0),
+        stats_data.get("sold_cars", 0)
+    ))
+
+    st.plotly_chart(fig_pie, use_container_width=True)
     
+    # Tableau de détails
+    with st.expander("📋 Détails des véhicules"):
+        render_cars_summary_table(api_client, cars_data)
+
+def render_reservations_chart(stats_data, api_client: APIClient):
+    """Rend le graphique des réservations"""
+
+    st.subheader("📋 État des Réservations")
+
+    fig_bar = _build_res_bar((
+        stats_data.get("pending_reservations", 0),
+        stats_data.get("confirmed_reservations", 0),
+        stats_data.get("completed_reservations", 0)
+    ))
+
     st.plotly_chart(fig_bar, use_container_width=True)
     
     # Tendance des réservations (simulée)
     with st.expander("📈 Tendance des réservations"):
         render_reservations_trend()
 
-def render_cars_summary_table(api_client: APIClient):
+def render_cars_summary_table(api_client: APIClient, cars_data=None):
     """Rend un tableau résumé des voitures"""
-    
-    # Charger les voitures
-    success, cars_data, _ = api_client.get_cars(size=10)
-    
+
+    # Utiliser les données préchargées si disponibles
+    if cars_data is None:
+        success, cars_data, _ = api_client.get_cars(size=10)
+    else:
+        success = True
+
     if success and cars_data:
         df = api_client.format_car_data(cars_data)
         
@@ -243,25 +328,34 @@ def render_cars_summary_table(api_client: APIClient):
     else:
         st.error("Impossible de charger les données des voitures")
 
+# Générateur partagé pour les données simulées (graine fixe : la
+# tendance reste stable d'un rerun à l'autre)
+rng = np.random.default_rng(0)
+
+@st.cache_data(ttl=3600)
+def _fake_trend():
+    """Construit la tendance simulée sur 31 jours (à remplacer par de vraies données)
+
+    Un seul appel vectorisé rng.integers au lieu de 31 random.randint,
+    et le DataFrame est mis en cache pendant une heure.
+    """
+    import pandas as pd
+
+    return pd.DataFrame({
+        "Date": pd.date_range(
+            start=datetime.now() - timedelta(days=30),
+            periods=31,
+            freq='D'
+        ),
+        "Réservations": rng.integers(0, 6, size=31)
+    })
+
 def render_reservations_trend():
     """Rend un graphique de tendance des réservations"""
-    
-    # Données simulées pour la tendance (à remplacer par de vraies données)
-    dates = pd.date_range(
-        start=datetime.now() - timedelta(days=30),
-        end=datetime.now(),
-        freq='D'
-    )
-    
-    # Simulation de données de réservations
-    import random
-    reservations_count = [random.randint(0, 5) for _ in range(len(dates))]
-    
-    df_trend = pd.DataFrame({
-        "Date": dates,
-        "Réservations": reservations_count
-    })
-    
+    import plotly.express as px
+
+    df_trend = _fake_trend()
+
     fig_trend = px.line(
         df_trend,
         x="Date",
@@ -274,147 +368,84 @@ def render_reservations_trend():
     
     st.plotly_chart(fig_trend, use_container_width=True)
 
-def render_recent_activity(api_client: APIClient):
-    """Rend l'activité récente"""
-    
+def render_recent_activity(cars_data, reservations_data):
+    """Rend l'activité récente (à partir des données préchargées)"""
+
     st.subheader("🕒 Activité Récente")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.markdown("#### 🚗 Derniers Véhicules Ajoutés")
-        render_recent_cars(api_client)
-    
+        render_recent_cars(cars_data)
+
     with col2:
         st.markdown("#### 📋 Dernières Réservations")
-        render_recent_reservations(api_client)
+        render_recent_reservations(reservations_data)
 
-def render_recent_cars(api_client: APIClient):
+def render_recent_cars(cars_data):
     """Rend les dernières voitures ajoutées"""
-    
-    success, cars_data, _ = api_client.get_cars(size=5)
-    
-    if success and cars_data:
-        # Trier par date de création (plus récent en premier)
-        cars_sorted = sorted(
-            cars_data, 
-            key=lambda x: x.get('created_at', ''), 
-            reverse=True
-        )[:5]
-        
-        for car in cars_sorted:
-            render_car_item(car)
+
+    if cars_data:
+        # Déjà triées par le backend (created_at décroissant).
+        # st.dataframe envoie les 5 lignes en un seul buffer Arrow au
+        # lieu de 5 blobs HTML
+        import pandas as pd
+
+        df = pd.DataFrame(cars_data[:5])
+        columns = [c for c in ('marque', 'modele', 'couleur', 'prix', 'disponibilite')
+                   if c in df.columns]
+
+        st.dataframe(
+            df[columns],
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "marque": st.column_config.TextColumn("Marque"),
+                "modele": st.column_config.TextColumn("Modèle"),
+                "couleur": st.column_config.TextColumn("Couleur"),
+                "prix": st.column_config.NumberColumn("Prix", format="%d €"),
+                "disponibilite": st.column_config.TextColumn("Statut"),
+            }
+        )
     else:
         st.info("Aucune donnée disponible")
 
-def render_recent_reservations(api_client: APIClient):
+def render_recent_reservations(reservations_data):
     """Rend les dernières réservations"""
-    
-    success, reservations_data, _ = api_client.get_reservations(size=5)
-    
-    if success and reservations_data:
-        # Trier par date de création (plus récent en premier)
-        reservations_sorted = sorted(
-            reservations_data, 
-            key=lambda x: x.get('created_at', ''), 
-            reverse=True
-        )[:5]
-        
-        for reservation in reservations_sorted:
-            render_reservation_item(reservation)
+
+    if reservations_data:
+        rows = [
+            {
+                "vehicule": "{} {}".format(
+                    (r.get('car') or {}).get('marque', ''),
+                    (r.get('car') or {}).get('modele', '')
+                ),
+                "client": "{} {}".format(
+                    (r.get('user') or {}).get('prenom', ''),
+                    (r.get('user') or {}).get('nom', '')
+                ),
+                "statut": r.get('statut', '').replace('_', ' ').title(),
+            }
+            for r in reservations_data[:5]
+        ]
+
+        import pandas as pd
+
+        st.dataframe(
+            pd.DataFrame(rows),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "vehicule": st.column_config.TextColumn("Véhicule"),
+                "client": st.column_config.TextColumn("Client"),
+                "statut": st.column_config.TextColumn("Statut"),
+            }
+        )
     else:
         st.info("Aucune donnée disponible")
 
-def render_car_item(car):
-    """Rend un élément de voiture"""
-    
-    status_colors = {
-        "disponible": "#38a169",
-        "loue": "#d69e2e",
-        "vendu": "#e53e3e"
-    }
-    
-    status_color = status_colors.get(car.get('disponibilite', ''), "#718096")
-    
-    st.markdown(f"""
-    <div style="
-        background: white;
-        padding: 1rem;
-        border-radius: 8px;
-        margin-bottom: 0.5rem;
-        border-left: 4px solid {status_color};
-        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    ">
-        <div style="font-weight: bold; color: #2d3748;">
-            {car.get('marque', '')} {car.get('modele', '')}
-        </div>
-        <div style="color: #718096; font-size: 0.9rem;">
-            {car.get('couleur', '')} • {car.get('prix', 0):,.0f} €
-        </div>
-        <div style="
-            display: inline-block;
-            background-color: {status_color};
-            color: white;
-            padding: 0.2rem 0.5rem;
-            border-radius: 12px;
-            font-size: 0.7rem;
-            font-weight: 600;
-            margin-top: 0.5rem;
-        ">
-            {car.get('disponibilite', '').title()}
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-def render_reservation_item(reservation):
-    """Rend un élément de réservation"""
-    
-    status_colors = {
-        "en_attente": "#d69e2e",
-        "confirmee": "#38a169",
-        "annulee": "#e53e3e",
-        "terminee": "#3182ce"
-    }
-    
-    status_color = status_colors.get(reservation.get('statut', ''), "#718096")
-    
-    # Extraction des informations
-    car_info = reservation.get('car', {})
-    user_info = reservation.get('user', {})
-    
-    car_name = f"{car_info.get('marque', '')} {car_info.get('modele', '')}"
-    user_name = f"{user_info.get('prenom', '')} {user_info.get('nom', '')}"
-    
-    st.markdown(f"""
-    <div style="
-        background: white;
-        padding: 1rem;
-        border-radius: 8px;
-        margin-bottom: 0.5rem;
-        border-left: 4px solid {status_color};
-        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    ">
-        <div style="font-weight: bold; color: #2d3748;">
-            {car_name}
-        </div>
-        <div style="color: #718096; font-size: 0.9rem;">
-            Client: {user_name}
-        </div>
-        <div style="
-            display: inline-block;
-            background-color: {status_color};
-            color: white;
-            padding: 0.2rem 0.5rem;
-            border-radius: 12px;
-            font-size: 0.7rem;
-            font-weight: 600;
-            margin-top: 0.5rem;
-        ">
-            {reservation.get('statut', '').replace('_', ' ').title()}
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
+@st.fragment
 def render_quick_actions():
     """Rend les actions rapides pour les vendeurs"""
     
@@ -436,11 +467,11 @@ def render_quick_actions():
                 st.rerun()
         
         with col3:
-            if st.button("🔄 Actualiser Données", use_container_width=True):
-                from utils.session_state import clear_cache
-                clear_cache()
-                st.success("✅ Données actualisées")
-                st.rerun()
+            # Dans un fragment, le rerun du clic ne repeint pas le reste
+            # de la page : forcer un rerun complet après la purge
+            if st.button("🔄 Actualiser Données", on_click=refresh_all,
+                         use_container_width=True):
+                st.rerun(scope="app")
         
         with col4:
             if st.button("📊 Rapport Complet", use_container_width=True):
@@ -13,6 +13,7 @@ def render(api_client):
     if success:
         st.write(f"📊 {len(reservations)} réservations trouvées")
         if reservations:
-            st.json(reservations[0])  # Affichage de la première réservation
+            import pandas as pd
+            st.dataframe(pd.DataFrame(reservations[:50]), use_container_width=True)
     else:
         st.error(f"❌ {message}")
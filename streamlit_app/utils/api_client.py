@@ -3,28 +3,88 @@
 Client API pour communiquer avec le backend FastAPI
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import streamlit as st
 import requests
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
-import json
+import orjson
+
+@lru_cache(maxsize=16)
+def _headers_for_token(token: Optional[str]) -> Dict[str, str]:
+    """Construit les headers d'une requête pour un token donné
+
+    Mémoïsé par token et jamais muté après construction : le client
+    étant un singleton partagé, un cache sur attribut d'instance
+    pouvait servir le token d'une session à une autre entre la
+    réaffectation et la lecture. Les appelants qui complètent les
+    headers doivent copier le dict.
+    """
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+# Fetchers mis en cache au niveau module : clés sur (token, page, size,
+# filtres, tri), partagés entre reruns et entre sessions. Sur un hit,
+# tout le round-trip réseau disparaît — le plus gros gain possible pour
+# un front Streamlit qui rejoue le script à chaque clic. Le token fait
+# partie de la clé pour qu'un changement d'utilisateur invalide le cache.
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_cars_cached(_client, token, page, size, filters_tuple, order_by, desc):
+    return _client._fetch_cars(page, size, dict(filters_tuple) if filters_tuple else None,
+                               order_by, desc)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_reservations_cached(_client, token, page, size, filters_tuple):
+    return _client._fetch_reservations(page, size,
+                                       dict(filters_tuple) if filters_tuple else None)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_dashboard_stats_cached(_client, token):
+    return _client._fetch_dashboard_stats()
 
 class APIClient:
     """Client pour interagir avec l'API FastAPI"""
+
+    # Messages des statuts d'erreur sans corps utile : table construite
+    # une fois à la définition de la classe, consultation O(1) au lieu
+    # d'une cascade if/elif par réponse
+    _STATUS_MESSAGES = {
+        401: "Non authentifié - Veuillez vous reconnecter",
+        403: "Accès refusé",
+        404: "Ressource non trouvée",
+    }
     
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.timeout = 30
+
+        # Session persistante : réutilise les connexions TCP (keep-alive)
+        # au lieu de repayer DNS + handshake à chaque appel, avec retries
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # ETag connus par (url, params) : permet les GET conditionnels
+        # If-None-Match — sur 304, on resservit le résultat déjà parsé
+        self._etag_cache = {}
     
     def _get_headers(self) -> Dict[str, str]:
-        """Retourne les headers avec le token d'authentification"""
-        headers = {"Content-Type": "application/json"}
-        
-        token = st.session_state.get("token")
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        
-        return headers
+        """Retourne les headers avec le token d'authentification (mémoïsés par token)"""
+        return _headers_for_token(st.session_state.get("token"))
     
     def _handle_response(self, response: requests.Response) -> Tuple[bool, Any, str]:
         """
@@ -33,54 +93,124 @@ class APIClient:
         Returns:
             Tuple[bool, Any, str]: (success, data, message)
         """
+        status = response.status_code
+        content = response.content
+
         try:
-            if response.status_code in [200, 201]:
-                data = response.json() if response.content else {}
-                return True, data, "Succès"
-            
-            elif response.status_code == 401:
-                return False, None, "Non authentifié - Veuillez vous reconnecter"
-            
-            elif response.status_code == 403:
-                return False, None, "Accès refusé"
-            
-            elif response.status_code == 404:
-                return False, None, "Ressource non trouvée"
-            
-            elif response.status_code == 422:
-                error_data = response.json() if response.content else {}
+            # orjson parse les bytes bruts (SIMD) : nettement plus rapide
+            # que response.json() sur les payloads de listes
+            if status in (200, 201):
+                return True, orjson.loads(content) if content else {}, "Succès"
+
+            # Statuts d'erreur connus sans corps à parser : table O(1)
+            message = self._STATUS_MESSAGES.get(status)
+            if message is not None:
+                return False, None, message
+
+            # 422 et autres : extraire le détail du corps s'il existe,
+            # sans tenter de parser une réponse vide
+            error_data = orjson.loads(content) if content else {}
+
+            if status == 422:
                 detail = error_data.get("detail", "Erreur de validation")
                 return False, None, f"Erreur de validation: {detail}"
-            
-            else:
-                error_data = response.json() if response.content else {}
-                detail = error_data.get("detail", f"Erreur HTTP {response.status_code}")
-                return False, None, detail
+
+            detail = error_data.get("detail", f"Erreur HTTP {status}")
+            return False, None, detail
                 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return False, None, f"Erreur de décodage JSON (Status: {response.status_code})"
         except Exception as e:
             return False, None, f"Erreur inattendue: {str(e)}"
     
+    def _get_with_etag(self, url: str, params: Dict = None) -> Tuple[bool, Any, str]:
+        """
+        GET conditionnel avec cache ETag
+
+        Si le serveur a déjà renvoyé un ETag pour ce couple (url, params),
+        le renvoie en If-None-Match : sur 304, le corps déjà parsé est
+        resservi sans transfert ni parse JSON. Sans ETag côté backend, le
+        comportement est identique à un GET simple.
+
+        Le token fait partie de la clé : le client est un singleton
+        partagé entre les sessions, un même couple (url, params) ne doit
+        jamais resservir la réponse d'un autre utilisateur.
+        """
+        key = (st.session_state.get("token"), url,
+               tuple(sorted(params.items())) if params else None)
+        cached = self._etag_cache.get(key)
+
+        headers = self._get_headers()
+        if cached:
+            headers = dict(headers)
+            headers["If-None-Match"] = cached[0]
+
+        response = self._session.get(url, headers=headers, params=params,
+                                     timeout=self.timeout)
+
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        result = self._handle_response(response)
+
+        etag = response.headers.get("ETag")
+        if etag and result[0]:
+            self._etag_cache[key] = (etag, result)
+
+        return result
+
+    def _request(self, method: str, path: str, **kwargs) -> Tuple[bool, Optional[Dict], str]:
+        """
+        Exécute une requête HTTP sur l'API et traite la réponse
+
+        Factorise le try/except répété dans chaque méthode CRUD : un seul
+        chemin de code pour la session poolée, les headers et la gestion
+        d'erreurs, que toutes les méthodes empruntent.
+        """
+        try:
+            response = self._session.request(
+                method,
+                f"{self.base_url}{path}",
+                headers=self._get_headers(),
+                timeout=self.timeout,
+                **kwargs
+            )
+
+            return self._handle_response(response)
+
+        except requests.exceptions.ConnectionError:
+            return False, None, "Impossible de se connecter au serveur API"
+        except Exception as e:
+            return False, None, f"Erreur: {str(e)}"
+
     # ========================================
     # GESTION DES VOITURES
     # ========================================
     
-    def get_cars(self, page: int = 1, size: int = 50, filters: Dict = None) -> Tuple[bool, List[Dict], str]:
-        """Récupère la liste des voitures"""
+    def get_cars(self, page: int = 1, size: int = 50, filters: Dict = None,
+                 order_by: str = None, desc: bool = False) -> Tuple[bool, List[Dict], str]:
+        """Récupère la liste des voitures (mise en cache 60 s par jeu de paramètres)"""
+        filters_tuple = tuple(sorted(filters.items())) if filters else None
+        return _fetch_cars_cached(
+            self, st.session_state.get("token"), page, size, filters_tuple, order_by, desc
+        )
+
+    def _fetch_cars(self, page: int = 1, size: int = 50, filters: Dict = None,
+                    order_by: str = None, desc: bool = False) -> Tuple[bool, List[Dict], str]:
+        """Va réellement chercher les voitures sur l'API"""
         try:
             params = {"page": page, "size": size}
+            if order_by:
+                # Tri délégué au backend (params sort_by/sort_order de
+                # /api/cars) : évite un sorted() Python côté client
+                params["sort_by"] = order_by
+                params["sort_order"] = "desc" if desc else "asc"
             if filters:
                 params.update(filters)
             
-            response = requests.get(
-                f"{self.base_url}/api/cars",
-                headers=self._get_headers(),
-                params=params,
-                timeout=self.timeout
+            success, data, message = self._get_with_etag(
+                f"{self.base_url}/api/cars", params
             )
-            
-            success, data, message = self._handle_response(response)
             if success:
                 # Gérer le format de réponse (peut être paginé ou direct)
                 cars = data.get("items", data) if isinstance(data, dict) else data
@@ -93,98 +223,158 @@ class APIClient:
         except Exception as e:
             return False, [], f"Erreur: {str(e)}"
     
-    def get_car_by_id(self, car_id: int) -> Tuple[bool, Optional[Dict], str]:
-        """Récupère une voiture par son ID"""
+    def get_cars_df(self, page: int = 1, size: int = 50) -> Tuple[bool, pd.DataFrame, str]:
+        """
+        Récupère les voitures en DataFrame via le transport Parquet
+
+        Contourne tout le chemin JSON (parse + liste de dicts +
+        constructeur DataFrame) : le backend sérialise en Parquet et
+        pd.read_parquet lit le buffer colonnaire directement.
+        """
         try:
-            response = requests.get(
-                f"{self.base_url}/api/cars/{car_id}",
+            response = self._session.get(
+                f"{self.base_url}/api/cars",
                 headers=self._get_headers(),
+                params={"page": page, "size": size, "format": "parquet"},
                 timeout=self.timeout
             )
-            
-            return self._handle_response(response)
-            
+
+            if response.status_code == 200:
+                import io
+                return True, pd.read_parquet(io.BytesIO(response.content)), "Succès"
+
+            success, _, message = self._handle_response(response)
+            return False, pd.DataFrame(), message
+
+        except requests.exceptions.ConnectionError:
+            return False, pd.DataFrame(), "Impossible de se connecter au serveur API"
         except Exception as e:
-            return False, None, f"Erreur: {str(e)}"
+            return False, pd.DataFrame(), f"Erreur: {str(e)}"
+
+    def iter_all_cars(self):
+        """
+        Itère sur toutes les voitures via le flux NDJSON du backend
+
+        Consomme /api/cars/stream ligne par ligne (une voiture par ligne
+        JSON) : pas de boucle de pagination côté client ni de
+        concaténation de pages, la mémoire reste bornée à une ligne.
+
+        Yields:
+            Dict: une voiture par itération
+        """
+        with self._session.get(
+            f"{self.base_url}/api/cars/stream",
+            headers=self._get_headers(),
+            timeout=self.timeout,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield orjson.loads(line)
+
+    def get_car_by_id(self, car_id: int) -> Tuple[bool, Optional[Dict], str]:
+        """Récupère une voiture par son ID"""
+        return self._request("GET", f"/api/cars/{car_id}")
     
     def create_car(self, car_data: Dict) -> Tuple[bool, Optional[Dict], str]:
         """Crée une nouvelle voiture"""
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/cars",
-                headers=self._get_headers(),
-                json=car_data,
-                timeout=self.timeout
-            )
-            
-            return self._handle_response(response)
-            
-        except Exception as e:
-            return False, None, f"Erreur: {str(e)}"
+        return self._request("POST", "/api/cars", json=car_data)
     
     def update_car(self, car_id: int, car_data: Dict) -> Tuple[bool, Optional[Dict], str]:
         """Met à jour une voiture"""
-        try:
-            response = requests.put(
-                f"{self.base_url}/api/cars/{car_id}",
-                headers=self._get_headers(),
-                json=car_data,
-                timeout=self.timeout
-            )
-            
-            return self._handle_response(response)
-            
-        except Exception as e:
-            return False, None, f"Erreur: {str(e)}"
+        return self._request("PUT", f"/api/cars/{car_id}", json=car_data)
     
     def delete_car(self, car_id: int) -> Tuple[bool, Optional[Dict], str]:
         """Supprime une voiture"""
-        try:
-            response = requests.delete(
-                f"{self.base_url}/api/cars/{car_id}",
-                headers=self._get_headers(),
-                timeout=self.timeout
-            )
-            
-            return self._handle_response(response)
-            
-        except Exception as e:
-            return False, None, f"Erreur: {str(e)}"
+        return self._request("DELETE", f"/api/cars/{car_id}")
     
     def update_car_availability(self, car_id: int, availability: str) -> Tuple[bool, Optional[Dict], str]:
         """Met à jour la disponibilité d'une voiture"""
-        try:
-            response = requests.patch(
-                f"{self.base_url}/api/cars/{car_id}/availability",
-                headers=self._get_headers(),
-                params={"availability": availability},
-                timeout=self.timeout
-            )
-            
-            return self._handle_response(response)
-            
-        except Exception as e:
-            return False, None, f"Erreur: {str(e)}"
+        return self._request("PATCH", f"/api/cars/{car_id}/availability",
+                             params={"availability": availability})
     
+    async def _apatch_many(self, requests_spec: List[Tuple[str, Dict]]):
+        """Envoie un lot de PATCH en concurrence (au plus 20 en vol)"""
+        limits = httpx.Limits(max_keepalive_connections=20)
+        semaphore = asyncio.Semaphore(20)
+
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._get_headers(),
+            timeout=self.timeout,
+            limits=limits
+        ) as client:
+
+            async def _one(path, kwargs):
+                async with semaphore:
+                    try:
+                        response = await client.patch(path, **kwargs)
+                        return self._handle_response(response)
+                    except Exception as e:
+                        return False, None, f"Erreur: {str(e)}"
+
+            return await asyncio.gather(
+                *[_one(path, kwargs) for path, kwargs in requests_spec]
+            )
+
+    def update_car_availability_many(self, items: List[Tuple[int, str]]) -> List[Tuple[bool, Optional[Dict], str]]:
+        """
+        Met à jour la disponibilité de plusieurs voitures en un lot concurrent
+
+        Les PATCH partent ensemble via asyncio.gather (plafonnés à 20 en
+        vol) : le temps total tombe de N·RTT à ~1·RTT, les lignes étant
+        indépendantes côté backend.
+
+        Args:
+            items: Liste de couples (car_id, availability)
+
+        Returns:
+            List[Tuple[bool, Optional[Dict], str]]: un triplet par voiture,
+            dans l'ordre d'entrée
+        """
+        return asyncio.run(self._apatch_many([
+            (f"/api/cars/{car_id}/availability", {"params": {"availability": availability}})
+            for car_id, availability in items
+        ]))
+
+    def update_reservation_status_many(self, items: List[Tuple[int, str]]) -> List[Tuple[bool, Optional[Dict], str]]:
+        """
+        Met à jour le statut de plusieurs réservations en un lot concurrent
+
+        Args:
+            items: Liste de couples (reservation_id, statut)
+        """
+        return asyncio.run(self._apatch_many([
+            (f"/api/reservations/{reservation_id}/status", {"json": {"statut": statut}})
+            for reservation_id, statut in items
+        ]))
+
     # ========================================
     # GESTION DES RÉSERVATIONS
     # ========================================
     
-    def get_reservations(self, page: int = 1, size: int = 50, filters: Dict = None) -> Tuple[bool, List[Dict], str]:
-        """Récupère la liste des réservations"""
+    def get_reservations(self, page: int = 1, size: int = 50,
+                         filters: Dict = None) -> Tuple[bool, List[Dict], str]:
+        """Récupère la liste des réservations (mise en cache 60 s par jeu de paramètres)"""
+        filters_tuple = tuple(sorted(filters.items())) if filters else None
+        return _fetch_reservations_cached(
+            self, st.session_state.get("token"), page, size, filters_tuple
+        )
+
+    def _fetch_reservations(self, page: int = 1, size: int = 50,
+                            filters: Dict = None) -> Tuple[bool, List[Dict], str]:
+        """Va réellement chercher les réservations sur l'API"""
         try:
+            # Pas de paramètre de tri : le backend renvoie toujours les
+            # réservations en created_at décroissant
             params = {"page": page, "size": size}
             if filters:
                 params.update(filters)
             
-            response = requests.get(
-                f"{self.base_url}/api/reservations",
-                headers=self._get_headers(),
-                params=params,
-                timeout=self.timeout
+            success, data, message = self._get_with_etag(
+                f"{self.base_url}/api/reservations", params
             )
-            
-            success, data, message = self._handle_response(response)
             if success:
                 reservations = data.get("items", data) if isinstance(data, dict) else data
                 return True, reservations, message
@@ -194,82 +384,143 @@ class APIClient:
         except Exception as e:
             return False, [], f"Erreur: {str(e)}"
     
-    def create_reservation(self, reservation_data: Dict) -> Tuple[bool, Optional[Dict], str]:
-        """Crée une nouvelle réservation"""
+    def get_reservations_df(self, page: int = 1, size: int = 50) -> Tuple[bool, pd.DataFrame, str]:
+        """Récupère les réservations en DataFrame via le transport Parquet"""
         try:
-            response = requests.post(
+            response = self._session.get(
                 f"{self.base_url}/api/reservations",
                 headers=self._get_headers(),
-                json=reservation_data,
+                params={"page": page, "size": size, "format": "parquet"},
                 timeout=self.timeout
             )
-            
-            return self._handle_response(response)
-            
+
+            if response.status_code == 200:
+                import io
+                return True, pd.read_parquet(io.BytesIO(response.content)), "Succès"
+
+            success, _, message = self._handle_response(response)
+            return False, pd.DataFrame(), message
+
+        except requests.exceptions.ConnectionError:
+            return False, pd.DataFrame(), "Impossible de se connecter au serveur API"
         except Exception as e:
-            return False, None, f"Erreur: {str(e)}"
+            return False, pd.DataFrame(), f"Erreur: {str(e)}"
+
+    def create_reservation(self, reservation_data: Dict) -> Tuple[bool, Optional[Dict], str]:
+        """Crée une nouvelle réservation"""
+        return self._request("POST", "/api/reservations", json=reservation_data)
     
     def update_reservation_status(self, reservation_id: int, status: str) -> Tuple[bool, Optional[Dict], str]:
         """Met à jour le statut d'une réservation"""
-        try:
-            response = requests.patch(
-                f"{self.base_url}/api/reservations/{reservation_id}/status",
-                headers=self._get_headers(),
-                json={"statut": status},
-                timeout=self.timeout
-            )
-            
-            return self._handle_response(response)
-            
-        except Exception as e:
-            return False, None, f"Erreur: {str(e)}"
+        return self._request("PATCH", f"/api/reservations/{reservation_id}/status",
+                             json={"statut": status})
     
     def cancel_reservation(self, reservation_id: int) -> Tuple[bool, Optional[Dict], str]:
         """Annule une réservation"""
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/reservations/{reservation_id}/cancel",
-                headers=self._get_headers(),
-                timeout=self.timeout
-            )
-            
-            return self._handle_response(response)
-            
-        except Exception as e:
-            return False, None, f"Erreur: {str(e)}"
+        return self._request("POST", f"/api/reservations/{reservation_id}/cancel")
     
     # ========================================
     # STATISTIQUES ET DASHBOARD
     # ========================================
-    
-    def get_dashboard_stats(self) -> Tuple[bool, Optional[Dict], str]:
-        """Récupère les statistiques du dashboard"""
+
+    async def _afetch(self, client: "httpx.AsyncClient", path: str,
+                      params: Dict = None) -> Tuple[bool, Any, str]:
+        """Exécute un GET asynchrone et traite la réponse"""
         try:
-            response = requests.get(
-                f"{self.base_url}/api/reservations/dashboard/stats",
-                headers=self._get_headers(),
-                timeout=self.timeout
-            )
-            
+            response = await client.get(path, params=params)
+            # httpx.Response expose status_code/content/json comme requests :
+            # _handle_response fonctionne tel quel
             return self._handle_response(response)
-            
+        except httpx.ConnectError:
+            return False, None, "Impossible de se connecter au serveur API"
         except Exception as e:
             return False, None, f"Erreur: {str(e)}"
+
+    async def _fetch_dashboard_bundle(self, cars_size: int, reservations_size: int):
+        """Lance les trois appels du dashboard en concurrence sur une même connexion"""
+        limits = httpx.Limits(max_keepalive_connections=20)
+
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._get_headers(),
+            timeout=self.timeout,
+            limits=limits
+        ) as client:
+            return await asyncio.gather(
+                self._afetch(client, "/api/reservations/dashboard/stats"),
+                self._afetch(client, "/api/cars", params={
+                    "page": 1, "size": cars_size,
+                    "sort_by": "created_at", "sort_order": "desc"
+                }),
+                # Réservations : pas de tri exposé, created_at desc par défaut
+                self._afetch(client, "/api/reservations", params={
+                    "page": 1, "size": reservations_size
+                }),
+            )
+
+    def fetch_dashboard_bundle(self, cars_size: int = 10, reservations_size: int = 5):
+        """
+        Récupère stats + voitures + réservations en un seul lot concurrent
+
+        Les trois requêtes partent ensemble via asyncio.gather sur un
+        httpx.AsyncClient partagé (keep-alive) : la latence totale tombe
+        au plus lent des trois appels au lieu de leur somme.
+
+        Returns:
+            Tuple[Tuple, Tuple, Tuple]: les triplets (success, data, message)
+            des stats, voitures et réservations
+        """
+        stats_result, cars_result, reservations_result = asyncio.run(
+            self._fetch_dashboard_bundle(cars_size, reservations_size)
+        )
+
+        # Déballer les listes éventuellement paginées comme get_cars/get_reservations
+        def _unwrap(result):
+            success, data, message = result
+            if success:
+                items = data.get("items", data) if isinstance(data, dict) else data
+                return True, items, message
+            return False, [], message
+
+        return stats_result, _unwrap(cars_result), _unwrap(reservations_result)
+
+
+    def get_dashboard_stats(self) -> Tuple[bool, Optional[Dict], str]:
+        """Récupère les statistiques du dashboard (mises en cache 60 s)"""
+        return _fetch_dashboard_stats_cached(self, st.session_state.get("token"))
+
+    def _fetch_dashboard_stats(self) -> Tuple[bool, Optional[Dict], str]:
+        """Va réellement chercher les statistiques sur l'API"""
+        return self._request("GET", "/api/reservations/dashboard/stats")
     
     def get_car_statistics(self) -> Tuple[bool, Optional[Dict], str]:
         """Récupère les statistiques des voitures"""
-        try:
-            response = requests.get(
-                f"{self.base_url}/api/cars/statistics",
-                headers=self._get_headers(),
-                timeout=self.timeout
-            )
-            
-            return self._handle_response(response)
-            
-        except Exception as e:
-            return False, None, f"Erreur: {str(e)}"
+        return self._request("GET", "/api/cars/statistics")
     
+    def prefetch_dashboard(self) -> Dict[str, Tuple]:
+        """
+        Précharge les données du dashboard en parallèle (variante threads)
+
+        Alternative synchrone à fetch_dashboard_bundle : le GIL est
+        relâché pendant les E/S requests, quatre threads ramènent donc
+        stats, statistiques voitures, voitures et réservations en
+        ~max(RTT) au lieu de leur somme, sur la Session poolée partagée.
+
+        Returns:
+            Dict[str, Tuple]: triplets (success, data, message) indexés par
+            "stats", "car_stats", "cars" et "reservations"
+        """
+        tasks = {
+            "stats": self.get_dashboard_stats,
+            "car_stats": self.get_car_statistics,
+            "cars": lambda: self.get_cars(page=1, size=10),
+            "reservations": lambda: self.get_reservations(page=1, size=10),
+        }
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {name: executor.submit(fn) for name, fn in tasks.items()}
+            return {name: future.result() for name, future in futures.items()}
+
     # ========================================
     # UTILITAIRES
     # ========================================
@@ -277,7 +528,7 @@ class APIClient:
     def test_connection(self) -> Tuple[bool, str]:
         """Teste la connexion avec l'API"""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/health",
                 timeout=5
             )
@@ -311,23 +562,31 @@ class APIClient:
         if not cars:
             return pd.DataFrame()
         
-        df = pd.DataFrame(cars)
-        
         # Colonnes à afficher
         display_columns = [
             'id', 'marque', 'modele', 'couleur', 'annee', 
             'prix', 'disponibilite', 'created_at'
         ]
         
-        existing_columns = [col for col in display_columns if col in df.columns]
-        df = df[existing_columns]
+        # Ne construire que les colonnes affichées : pandas ne type ni
+        # n'alloue les colonnes backend qui seraient jetées juste après
+        df = pd.DataFrame(cars, columns=display_columns)
         
-        # Formatage des colonnes
+        # Faible cardinalité : les codes entiers de Categorical remplacent
+        # les comparaisons de chaînes en aval (groupby, égalité)
+        if 'disponibilite' in df.columns:
+            df['disponibilite'] = df['disponibilite'].astype('category')
+        
+        # Formatage des colonnes (vectorisé : pas de lambda par ligne)
         if 'prix' in df.columns:
-            df['prix'] = df['prix'].apply(lambda x: f"{x:,.0f} €" if pd.notnull(x) else "")
+            prix = pd.to_numeric(df['prix'], errors='coerce')
+            df['prix'] = prix.map("{:,.0f} €".format).where(prix.notna(), "")
         
         if 'created_at' in df.columns:
-            df['created_at'] = pd.to_datetime(df['created_at']).dt.strftime('%d/%m/%Y')
+            # format="ISO8601" : parseur C, pas de fallback dateutil par ligne
+            df['created_at'] = pd.to_datetime(
+                df['created_at'], format='ISO8601', errors='coerce'
+            ).dt.strftime('%d/%m/%Y')
         
         # Renommage des colonnes
         column_rename = {
@@ -350,20 +609,27 @@ class APIClient:
         if not reservations:
             return pd.DataFrame()
         
-        df = pd.DataFrame(reservations)
+        # json_normalize aplatit les dicts imbriqués (car_*, user_*) en un
+        # seul passage C au lieu d'un .apply Python par ligne ; max_level
+        # borne la descente aux deux niveaux réellement utilisés
+        df = pd.json_normalize(reservations, sep='_', max_level=2)
         
-        # Extraction des informations imbriquées
-        if 'car' in df.columns:
-            df['car_info'] = df['car'].apply(
-                lambda x: f"{x.get('marque', '')} {x.get('modele', '')}" 
-                if isinstance(x, dict) else ""
-            )
+        # Extraction des informations imbriquées (concaténations
+        # vectorisées) ; les colonnes absentes sont remplacées par une
+        # Series vide, df.get rendrait un str scalaire sans .fillna
+        empty = pd.Series("", index=df.index)
         
-        if 'user' in df.columns:
-            df['user_info'] = df['user'].apply(
-                lambda x: f"{x.get('prenom', '')} {x.get('nom', '')}" 
-                if isinstance(x, dict) else ""
-            )
+        if 'car_marque' in df.columns:
+            car_modele = df['car_modele'] if 'car_modele' in df.columns else empty
+            df['car_info'] = (
+                df['car_marque'].fillna("") + " " + car_modele.fillna("")
+            ).str.strip()
+        
+        if 'user_prenom' in df.columns:
+            user_nom = df['user_nom'] if 'user_nom' in df.columns else empty
+            df['user_info'] = (
+                df['user_prenom'].fillna("") + " " + user_nom.fillna("")
+            ).str.strip()
         
         # Colonnes à afficher
         display_columns = [
@@ -374,17 +640,24 @@ class APIClient:
         existing_columns = [col for col in display_columns if col in df.columns]
         df = df[existing_columns]
         
+        # Colonnes à faible cardinalité : une seule chaîne par catégorie
+        for col in ('statut', 'type_transaction'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
         # Formatage des dates
         date_columns = ['date_debut', 'created_at']
         for col in date_columns:
             if col in df.columns:
-                df[col] = pd.to_datetime(df[col]).dt.strftime('%d/%m/%Y')
+                # format="ISO8601" : parseur C, pas de fallback dateutil
+                df[col] = pd.to_datetime(
+                    df[col], format='ISO8601', errors='coerce'
+                ).dt.strftime('%d/%m/%Y')
         
-        # Formatage du prix
+        # Formatage du prix (vectorisé)
         if 'prix_final' in df.columns:
-            df['prix_final'] = df['prix_final'].apply(
-                lambda x: f"{x:,.0f} €" if pd.notnull(x) else ""
-            )
+            prix = pd.to_numeric(df['prix_final'], errors='coerce')
+            df['prix_final'] = prix.map("{:,.0f} €".format).where(prix.notna(), "")
         
         # Renommage des colonnes
         column_rename = {
@@ -400,4 +673,11 @@ class APIClient:
         
         df = df.rename(columns=column_rename)
         
-        return df
\ No newline at end of file
+        return df
+
+# Fabrique singleton : le client (pool de connexions, cache de headers,
+# cache ETag) survit aux reruns au lieu d'être reconstruit à chaque
+# exécution du script
+@st.cache_resource
+def get_api_client() -> "APIClient":
+    return APIClient()
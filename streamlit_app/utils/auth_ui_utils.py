@@ -6,8 +6,29 @@ Module de gestion d'authentification pour Streamlit
 import streamlit as st
 import requests
 import json
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Tuple, Dict, Optional
 
+@lru_cache(maxsize=64)
+def _derive_identity(prenom: str, nom: str) -> Tuple[str, str]:
+    """Nom complet et initiales pour un couple (prenom, nom)
+
+    Fonction pure mémoïsée : pas d'état mutable sur le singleton
+    AuthManager, donc aucun risque qu'une session lise le nom ou le
+    rôle d'une autre entre deux réaffectations.
+    """
+    full_name = f"{prenom} {nom}".strip() or "Utilisateur"
+
+    initials = ""
+    if prenom:
+        initials += prenom[0].upper()
+    if nom:
+        initials += nom[0].upper()
+
+    return full_name, initials or "U"
+
 class AuthManager:
     """Gestionnaire d'authentification"""
     
@@ -15,6 +36,16 @@ class AuthManager:
         self.api_base_url = api_base_url
         self.login_endpoint = f"{api_base_url}/api/auth/login"
         self.me_endpoint = f"{api_base_url}/api/auth/me"
+
+        # Session persistante avec pool de connexions et retries
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
     
     def login(self, email: str, password: str) -> Tuple[bool, Optional[Dict], str]:
         """
@@ -31,7 +62,7 @@ class AuthManager:
             }
             
             # Requête de connexion
-            response = requests.post(
+            response = self._session.post(
                 self.login_endpoint,
                 json=login_data,
                 headers={"Content-Type": "application/json"},
@@ -86,7 +117,7 @@ class AuthManager:
                 "Content-Type": "application/json"
             }
             
-            response = requests.get(
+            response = self._session.get(
                 self.me_endpoint,
                 headers=headers,
                 timeout=10
@@ -122,8 +153,7 @@ class AuthManager:
     
     def get_user_role(self) -> Optional[str]:
         """Retourne le rôle de l'utilisateur actuel"""
-        user = st.session_state.get("user", {})
-        return user.get("role")
+        return st.session_state.get("user", {}).get("role")
     
     def is_vendeur(self) -> bool:
         """Vérifie si l'utilisateur est un vendeur"""
@@ -136,23 +166,12 @@ class AuthManager:
     def get_user_name(self) -> str:
         """Retourne le nom complet de l'utilisateur"""
         user = st.session_state.get("user", {})
-        prenom = user.get("prenom", "")
-        nom = user.get("nom", "")
-        return f"{prenom} {nom}".strip() or "Utilisateur"
+        return _derive_identity(user.get("prenom", ""), user.get("nom", ""))[0]
     
     def get_user_initials(self) -> str:
         """Retourne les initiales de l'utilisateur"""
         user = st.session_state.get("user", {})
-        prenom = user.get("prenom", "")
-        nom = user.get("nom", "")
-        
-        initials = ""
-        if prenom:
-            initials += prenom[0].upper()
-        if nom:
-            initials += nom[0].upper()
-        
-        return initials or "U"
+        return _derive_identity(user.get("prenom", ""), user.get("nom", ""))[1]
     
     def check_permission(self, required_role: str = None) -> bool:
         """
@@ -191,4 +210,11 @@ class AuthManager:
         
         if not self.check_permission(role):
             st.error(f"🚫 Accès refusé. Rôle '{role}' requis.")
-            st.stop()
\ No newline at end of file
+            st.stop()
+
+# Fabrique singleton : conserve la session HTTP et le cache utilisateur
+# entre les reruns. La déconnexion ne vide pas ce cache_resource : elle
+# ne touche que le token et l'utilisateur en session_state.
+@st.cache_resource
+def get_auth_manager() -> "AuthManager":
+    return AuthManager()
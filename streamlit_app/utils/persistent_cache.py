@@ -0,0 +1,52 @@
+# utils/persistent_cache.py
+"""
+Cache disque persistant pour les réponses API
+
+Complète st.cache_data (en mémoire, perdu à chaque redémarrage) : au
+redémarrage de l'application, le dashboard repeint depuis le disque en
+quelques millisecondes au lieu de repayer une salve d'appels API.
+"""
+
+import functools
+
+import diskcache
+
+# Cache partagé entre les sessions et les redémarrages du process
+cache = diskcache.Cache("./.cache/api")
+
+# Sentinelle pour distinguer "absent" d'un résultat None mis en cache
+_MISS = object()
+
+def disk_memoize(expire: int = 600):
+    """
+    Décorateur : persiste le résultat de la fonction sur disque.
+
+    Conçu pour les loaders API dont le premier argument est le client
+    (préfixé d'un underscore pour st.cache_data) : ce premier argument
+    est exclu de la clé de cache, les suivants en font partie. Le cache
+    disque étant partagé entre utilisateurs et redémarrages, les loaders
+    doivent inclure le token dans leurs arguments pour cloisonner les
+    données par utilisateur.
+
+    Args:
+        expire: Durée de vie de l'entrée disque en secondes
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(_client, *args, **kwargs):
+            key = (func.__name__,) + args + tuple(sorted(kwargs.items()))
+
+            result = cache.get(key, default=_MISS)
+            if result is not _MISS:
+                return result
+
+            result = func(_client, *args, **kwargs)
+
+            # Ne persister que les réponses réussies (success, data, message)
+            if not isinstance(result, tuple) or result[0]:
+                cache.set(key, result, expire=expire)
+
+            return result
+
+        return wrapper
+    return decorator
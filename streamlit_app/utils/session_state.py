@@ -6,68 +6,43 @@ Gestion du state de session pour Streamlit
 import streamlit as st
 from typing import Any, Dict
 
-def init_session_state():
-    """Initialise les variables de session state"""
-    
+# Registre des clés de filtres posées via set_filters : un clear global
+# parcourt ce set au lieu de scanner tout st.session_state avec des
+# .endswith par clé
+_REGISTERED_FILTER_KEYS = {"car_filters", "reservation_filters"}
+
+# Valeurs par défaut de la session : une seule table module au lieu
+# d'une cascade de "if not in" rejouée à chaque rerun. Les valeurs
+# mutables sont des fabriques pour ne pas partager d'instance.
+_DEFAULTS = {
     # État d'authentification
-    if "authenticated" not in st.session_state:
-        st.session_state.authenticated = False
-    
-    if "token" not in st.session_state:
-        st.session_state.token = None
-    
-    if "user" not in st.session_state:
-        st.session_state.user = {}
-    
-    # Cache des données
-    if "cars_cache" not in st.session_state:
-        st.session_state.cars_cache = []
-    
-    if "reservations_cache" not in st.session_state:
-        st.session_state.reservations_cache = []
-    
-    if "stats_cache" not in st.session_state:
-        st.session_state.stats_cache = {}
-    
-    # Timestamps pour le cache
-    if "cars_cache_time" not in st.session_state:
-        st.session_state.cars_cache_time = 0
-    
-    if "reservations_cache_time" not in st.session_state:
-        st.session_state.reservations_cache_time = 0
-    
-    if "stats_cache_time" not in st.session_state:
-        st.session_state.stats_cache_time = 0
-    
+    "authenticated": False,
+    "token": None,
+    # Utilisateur
+    "user": dict,
     # Filtres et état des pages
-    if "car_filters" not in st.session_state:
-        st.session_state.car_filters = {}
-    
-    if "reservation_filters" not in st.session_state:
-        st.session_state.reservation_filters = {}
-    
+    "car_filters": dict,
+    "reservation_filters": dict,
     # État des formulaires
-    if "form_data" not in st.session_state:
-        st.session_state.form_data = {}
-    
+    "form_data": dict,
     # Page actuelle
-    if "current_page" not in st.session_state:
-        st.session_state.current_page = "Dashboard"
-    
+    "current_page": "Dashboard",
     # Messages flash
-    if "flash_messages" not in st.session_state:
-        st.session_state.flash_messages = []
-    
+    "flash_messages": list,
     # État de chargement
-    if "loading" not in st.session_state:
-        st.session_state.loading = False
+    "loading": False,
+}
+
+def init_session_state():
+    """Initialise les variables de session state"""
+    for key, default in _DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = default() if callable(default) else default
 
 def clear_session_state():
     """Nettoie le session state (déconnexion)"""
     keys_to_clear = [
-        "authenticated", "token", "user", 
-        "cars_cache", "reservations_cache", "stats_cache",
-        "cars_cache_time", "reservations_cache_time", "stats_cache_time",
+        "authenticated", "token", "user",
         "car_filters", "reservation_filters", "form_data",
         "flash_messages"
     ]
@@ -134,64 +109,23 @@ def is_loading() -> bool:
     """Vérifie si l'application est en cours de chargement"""
     return st.session_state.get("loading", False)
 
-def cache_data(key: str, data: Any, expiry_minutes: int = 5):
+def refresh_all():
     """
-    Met en cache des données avec expiration
-    
-    Args:
-        key: Clé du cache
-        data: Données à mettre en cache
-        expiry_minutes: Durée d'expiration en minutes
-    """
-    import time
-    
-    cache_key = f"{key}_cache"
-    time_key = f"{key}_cache_time"
-    
-    st.session_state[cache_key] = data
-    st.session_state[time_key] = time.time() + (expiry_minutes * 60)
+    Callback de rafraîchissement global (à passer en on_click)
 
-def get_cached_data(key: str) -> Any:
-    """
-    Récupère des données du cache si elles ne sont pas expirées
-    
-    Args:
-        key: Clé du cache
-        
-    Returns:
-        Les données en cache ou None si expirées/inexistantes
+    Exécuté par Streamlit avant le rerun déclenché par le clic. Les
+    boutons hébergés dans un fragment doivent enchaîner le clic avec
+    st.rerun(scope="app") : le rerun automatique reste sinon limité au
+    fragment et la page principale garderait les données périmées.
     """
-    import time
-    
-    cache_key = f"{key}_cache"
-    time_key = f"{key}_cache_time"
-    
-    if cache_key in st.session_state and time_key in st.session_state:
-        if time.time() < st.session_state[time_key]:
-            return st.session_state[cache_key]
-    
-    return None
+    # Vider aussi la couche disque sous les loaders du dashboard :
+    # st.cache_data.clear() seul se repeuplerait depuis des entrées
+    # disque vieilles de 10 minutes au lieu de refetcher l'API
+    from utils.persistent_cache import cache as disk_cache
 
-def clear_cache(key: str = None):
-    """
-    Vide le cache
-    
-    Args:
-        key: Clé spécifique à vider, ou None pour tout vider
-    """
-    if key:
-        cache_key = f"{key}_cache"
-        time_key = f"{key}_cache_time"
-        
-        if cache_key in st.session_state:
-            del st.session_state[cache_key]
-        if time_key in st.session_state:
-            del st.session_state[time_key]
-    else:
-        # Vider tout le cache
-        cache_keys = [k for k in st.session_state.keys() if k.endswith("_cache") or k.endswith("_cache_time")]
-        for k in cache_keys:
-            del st.session_state[k]
+    st.cache_data.clear()
+    disk_cache.clear()
+    st.toast("✅ Données actualisées")
 
 def save_form_data(form_name: str, data: Dict):
     """Sauvegarde les données d'un formulaire"""
@@ -215,6 +149,7 @@ def clear_form_data(form_name: str = None):
 def set_filters(filter_type: str, filters: Dict):
     """Définit les filtres pour une page"""
     filter_key = f"{filter_type}_filters"
+    _REGISTERED_FILTER_KEYS.add(filter_key)
     st.session_state[filter_key] = filters
 
 def get_filters(filter_type: str) -> Dict:
@@ -228,9 +163,10 @@ def clear_filters(filter_type: str = None):
         filter_key = f"{filter_type}_filters"
         st.session_state[filter_key] = {}
     else:
-        filter_keys = [k for k in st.session_state.keys() if k.endswith("_filters")]
-        for k in filter_keys:
-            st.session_state[k] = {}
+        # O(clés enregistrées) au lieu d'un scan linéaire de la session
+        for filter_key in _REGISTERED_FILTER_KEYS:
+            if filter_key in st.session_state:
+                st.session_state[filter_key] = {}
 
 def get_user() -> Dict:
     """Récupère l'utilisateur actuel"""
@@ -250,14 +186,28 @@ def get_token() -> str:
     return st.session_state.get("token", "")
 
 def debug_session_state():
-    """Affiche le contenu du session state pour debug"""
+    """Affiche le contenu du session state pour debug
+
+    Le corps ne s'exécute que si la case est cochée : plus de parcours
+    de toutes les clés (ni de str() sur de gros objets) à chaque rerun
+    quand le debug est inactif.
+    """
     st.sidebar.markdown("### 🐛 Debug Session State")
-    
-    with st.sidebar.expander("Voir Session State"):
+
+    if not st.sidebar.checkbox("Voir Session State", value=False):
+        return
+
+    with st.sidebar.expander("Session State", expanded=True):
         for key, value in st.session_state.items():
-            if not key.startswith("_"):  # Éviter les clés internes de Streamlit
-                st.write(f"**{key}:** {type(value)}")
-                if not isinstance(value, (dict, list)) or len(str(value)) < 100:
-                    st.write(value)
-                else:
-                    st.write(f"[{type(value).__name__} avec {len(value) if hasattr(value, '__len__') else '?'} éléments]")
\ No newline at end of file
+            if key.startswith("_"):  # Éviter les clés internes de Streamlit
+                continue
+
+            st.write(f"**{key}:** {type(value)}")
+
+            # Ne jamais stringifier les gros objets (DataFrame, listes,
+            # dicts) : afficher seulement type et taille
+            if isinstance(value, (int, float, bool, str)) and len(repr(value)) < 100:
+                st.write(value)
+            else:
+                size = len(value) if hasattr(value, '__len__') else '?'
+                st.write(f"[{type(value).__name__} avec {size} éléments]")
\ No newline at end of file